@@ -1,112 +1,365 @@
 import sys
 import os
-import json
-import platform
 from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QPushButton, QLabel, QLineEdit, 
                             QComboBox, QSystemTrayIcon, QMenu, QMessageBox,
                             QFileDialog, QStackedWidget, QDialog, QCheckBox, QScrollArea,
-                            QTabWidget)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QIcon, QAction
-import pystray
-from PIL import Image
-from screenshot_organizer import process_screenshots
-from user_manager import UserManager, UserRegistrationDialog, show_promotional_message
-from datetime import datetime
+                            QTabWidget, QGridLayout, QFrame)
+from PyQt6.QtCore import (Qt, QThread, pyqtSignal, QTimer, QFileSystemWatcher, QObject,
+                          QRunnable, QThreadPool, QEvent)
+from PyQt6.QtGui import QIcon, QAction, QFont
+from user_manager import UserManager, UserRegistrationDialog, PromotionalDialog, open_url
+from config_manager import (IS_WINDOWS, IS_MAC, get_app_data_dir, get_config_path,
+                            load_json_cached, save_json, invalidate_cached,
+                            add_save_listener)
+from datetime import date
 import logging
-import traceback
-import webbrowser
 import time
 import threading
+import collections
+from functools import partial
+from types import MappingProxyType
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Platform-specific settings
-IS_WINDOWS = platform.system() == "Windows"
-IS_MAC = platform.system() == "Darwin"
-
-def get_config_path(filename):
-    """Get the platform-specific path for config files"""
-    if platform.system() == "Windows":
-        config_dir = os.path.join(os.getenv('APPDATA'), 'ScreenshotOrganizer')
-    elif platform.system() == "Darwin":  # macOS
-        config_dir = os.path.join(os.path.expanduser('~/Library/Application Support/ScreenshotOrganizer'))
-    else:  # Linux
-        config_dir = os.path.expanduser('~/.screenshotorganizer')
-    
-    # Create config directory if it doesn't exist
-    os.makedirs(config_dir, exist_ok=True)
+# Number of watched folders the Folders tab offers
+MAX_FOLDERS = 3
+
+# Minimum seconds between progress signals from the processing job (~20 Hz)
+PROGRESS_INTERVAL = 0.05
+
+# Seconds to let a burst of new-file events settle before sweeping their folders
+QUEUE_DEBOUNCE = 0.2
+
+# Milliseconds to wait for the processing job and describe threads at exit
+# before giving up on them
+SHUTDOWN_TIMEOUT_MS = 3000
+
+# File extensions the watcher reports, compared against the lowercased suffix
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg'})
+
+# How many (path, mtime, size) keys the polling watcher remembers
+SEEN_FILES_CAP = 4096
+
+# Defaults written by initialize_config_files; read-only so they are built once
+_DEFAULT_SETTINGS = MappingProxyType({
+    'provider': 'Together AI',
+    'model': 'Llama-3.2-11B-Vision-Instruct-Turbo',
+    'together_url': 'https://api.together.xyz',
+    'together_api_key': '',
+    'ollama_url': 'http://localhost:11434',
+    'ollama_api_key': '',
+    'stats': MappingProxyType({
+        'total_images_processed': 0,
+        'last_processed_date': None,
+        'categories_created': ()
+    })
+})
+_DEFAULT_PROMOS = MappingProxyType({"promotions": ()})
+
+# Application-wide stylesheet, parsed once by QApplication in main().
+# Widgets opt in via setObjectName() rather than carrying their own sheets.
+APP_QSS = """
+    /* Settings */
+    QWidget#settingsCard {
+        background-color: #FFFFFF;
+        border: 1px solid #BBDEFB;
+        border-radius: 10px;
+        padding: 15px;
+    }
+    #settingsCard QLabel {
+        color: #1565C0;
+    }
+    #settingsCard QComboBox {
+        padding: 8px;
+        border: 1px solid #BBDEFB;
+        border-radius: 4px;
+        min-width: 200px;
+        color: #424242;
+        background-color: white;
+    }
+    #settingsCard QComboBox::drop-down {
+        border: none;
+    }
+    #settingsCard QComboBox::down-arrow {
+        image: url(down_arrow.png);
+        width: 12px;
+        height: 12px;
+    }
+    #settingsCard QComboBox QAbstractItemView {
+        background-color: white;
+        color: #424242;
+        selection-background-color: #E3F2FD;
+        selection-color: #1565C0;
+    }
+    #settingsCard QLineEdit {
+        padding: 8px;
+        border: 1px solid #BBDEFB;
+        border-radius: 4px;
+        color: #424242;
+        background-color: white;
+    }
+    QPushButton#saveButton {
+        background-color: #4CAF50;
+        color: white;
+        padding: 10px 20px;
+        border: none;
+        border-radius: 4px;
+        font-size: 14px;
+        min-width: 120px;
+    }
+    QPushButton#saveButton:hover {
+        background-color: #45a049;
+    }
+
+    /* Dashboard */
+    QFrame#welcomeCard {
+        background-color: #E3F2FD;
+        border: 1px solid #90CAF9;
+        border-radius: 10px;
+        padding: 15px;
+    }
+    QFrame#statsCard {
+        background-color: #FFFFFF;
+        border: 1px solid #BBDEFB;
+        border-radius: 10px;
+        padding: 15px;
+    }
+    QFrame#guideCard {
+        background-color: #FFF3E0;
+        border: 1px solid #FFE0B2;
+        border-radius: 10px;
+        padding: 15px;
+    }
+    QFrame#consentCard {
+        background-color: #FFEBEE;
+        border: 1px solid #FFCDD2;
+        border-radius: 10px;
+        padding: 15px;
+    }
+    QLabel#dashboardTitle {
+        font-size: 24px;
+        font-weight: bold;
+        color: #1565C0;
+    }
+    QLabel#byLabel {
+        color: #666;
+        font-size: 14px;
+    }
+    QLabel#channelLabel {
+        color: #1565C0;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#subscribeButton {
+        background-color: #FF0000;
+        color: white;
+        padding: 4px 12px;
+        border: none;
+        border-radius: 3px;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QPushButton#subscribeButton:hover {
+        background-color: #CC0000;
+    }
+    QLabel#statsTitle {
+        font-size: 18px;
+        font-weight: bold;
+        color: #1565C0;
+    }
+    QLabel#statsLabel {
+        font-size: 14px;
+        color: #424242;
+    }
+    QLabel#guideTitle {
+        font-size: 18px;
+        font-weight: bold;
+        color: #E65100;
+    }
+    QLabel#guideStep {
+        font-size: 14px;
+        color: #424242;
+    }
+    QLabel#consentTitle {
+        font-size: 18px;
+        font-weight: bold;
+        color: #C62828;
+    }
+    QCheckBox#consentCheckbox {
+        font-size: 14px;
+        color: #424242;
+    }
+    QCheckBox#consentCheckbox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QCheckBox#consentCheckbox::indicator:unchecked {
+        border: 2px solid #C62828;
+        border-radius: 3px;
+    }
+    QCheckBox#consentCheckbox::indicator:checked {
+        background-color: #C62828;
+        border: 2px solid #C62828;
+        border-radius: 3px;
+    }
+
+    /* Processing controls */
+    QPushButton#controlButton {
+        background-color: #1976D2;
+        color: white;
+        padding: 8px 15px;
+        border: none;
+        border-radius: 4px;
+        font-size: 14px;
+        min-width: 100px;
+    }
+    QPushButton#controlButton:hover {
+        background-color: #1565C0;
+    }
+    QPushButton#controlButton:checked {
+        background-color: #0D47A1;
+    }
+    QPushButton#controlButton:disabled {
+        background-color: #BBDEFB;
+        color: #78909C;
+    }
+"""
+
+# Shared by every settings field label; built on first use since QFont
+# needs a running QApplication
+_field_label_font = None
+
+def make_field_label(text):
+    """Create a bold settings field label using the shared font"""
+    global _field_label_font
+    if _field_label_font is None:
+        _field_label_font = QFont()
+        _field_label_font.setPixelSize(16)
+        _field_label_font.setBold(True)
     
-    # Return full path to the config file
-    return os.path.join(config_dir, filename)
+    label = QLabel(text)
+    label.setFont(_field_label_font)
+    return label
+
+# App icon, decoded from disk once per process
+_app_icon = None
+
+def get_app_icon():
+    """Load the app icon on first use and reuse it for the window and tray"""
+    global _app_icon
+    if _app_icon is None:
+        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icon.png')
+        _app_icon = QIcon(icon_path)
+    return _app_icon
+
+# Worker threads for the per-folder sweep, kept alive between processing runs.
+# Separate from the global pool, whose thread the ProcessingJob itself occupies.
+_folder_pool = None
+
+def get_folder_pool():
+    """Create the folder sweep pool on first use and reuse it afterwards"""
+    global _folder_pool
+    if _folder_pool is None:
+        _folder_pool = QThreadPool()
+        _folder_pool.setMaxThreadCount(min(MAX_FOLDERS, os.cpu_count() or 1))
+    return _folder_pool
+
+def unique_folders(folders):
+    """Drop watched folders that resolve to the same real path as an earlier one"""
+    # Two entries for one directory (e.g. via a symlink) would sweep the same
+    # files concurrently. Nested folders are kept: a sweep only scans the top
+    # level of its folder, so they never share files
+    seen = set()
+    unique = []
+    for folder in folders:
+        real = os.path.normcase(os.path.realpath(folder))
+        if real in seen:
+            logger.info(f"Skipping {folder}: same folder as another watched folder")
+            continue
+        seen.add(real)
+        unique.append(folder)
+    return unique
+
+def show_message(parent, icon, title, text):
+    """Show a message box without blocking the event loop; it deletes itself when closed"""
+    box = QMessageBox(icon, title, text, QMessageBox.StandardButton.Ok, parent)
+    box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+    box.open()
+    return box
 
 def initialize_config_files():
     """Initialize default configuration files if they don't exist"""
-    # Default settings
-    settings = {
-        'provider': 'Together AI',
-        'model': 'Llama-3.2-11B-Vision-Instruct-Turbo',
-        'together_url': 'https://api.together.xyz',
-        'together_api_key': '',
-        'ollama_url': 'http://localhost:11434',
-        'ollama_api_key': '',
-        'stats': {
-            'total_images_processed': 0,
-            'last_processed_date': None,
-            'categories_created': []
-        }
-    }
+    config_dir = get_app_data_dir()
     
-    # Create config directory if it doesn't exist
-    if platform.system() == "Windows":
-        config_dir = os.path.join(os.getenv('APPDATA'), 'ScreenshotOrganizer')
-    elif platform.system() == "Darwin":  # macOS
-        config_dir = os.path.join(os.path.expanduser('~/Library/Application Support/ScreenshotOrganizer'))
-    else:  # Linux
-        config_dir = os.path.expanduser('~/.screenshotorganizer')
+    # Once every file has been created, a single marker stat replaces the per-file checks
+    marker_path = Path(config_dir) / '.initialized'
+    if marker_path.exists():
+        return
     
-    os.makedirs(config_dir, exist_ok=True)
+    # One directory listing answers every "does it exist" question below
+    with os.scandir(config_dir) as entries:
+        present = {entry.name for entry in entries}
     
+    # Files are written through save_json so the first readers hit the config cache
     # Initialize settings.json if it doesn't exist
     settings_path = os.path.join(config_dir, 'settings.json')
-    if not os.path.exists(settings_path):
-        with open(settings_path, 'w') as f:
-            json.dump(settings, f, indent=4)
-            logger.info(f"Created default settings at {settings_path}")
+    if 'settings.json' not in present:
+        save_json(settings_path, dict(_DEFAULT_SETTINGS, stats=dict(_DEFAULT_SETTINGS['stats'])))
+        logger.info(f"Created default settings at {settings_path}")
     
     # Initialize user_data.json if it doesn't exist
     user_data_path = os.path.join(config_dir, 'user_data.json')
-    if not os.path.exists(user_data_path):
-        with open(user_data_path, 'w') as f:
-            json.dump({'registered': False, 'last_promo_check': None}, f, indent=4)
-            logger.info(f"Created user_data.json at {user_data_path}")
+    if 'user_data.json' not in present:
+        save_json(user_data_path, {'registered': False, 'last_promo_check': None}, indent=None)
+        logger.info(f"Created user_data.json at {user_data_path}")
     
     # Initialize folders.json if it doesn't exist
     folders_path = os.path.join(config_dir, 'folders.json')
-    if not os.path.exists(folders_path):
-        with open(folders_path, 'w') as f:
-            json.dump([], f, indent=4)
-            logger.info(f"Created folders.json at {folders_path}")
+    if 'folders.json' not in present:
+        save_json(folders_path, [], indent=None)
+        logger.info(f"Created folders.json at {folders_path}")
     
     # Copy promotions.json from repo if it exists, otherwise create default
     repo_promotions_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'promotions.json')
     config_promotions_path = os.path.join(config_dir, 'promotions.json')
     
-    if not os.path.exists(config_promotions_path):
+    if 'promotions.json' not in present:
         if os.path.exists(repo_promotions_path):
             # Copy from repo
-            with open(repo_promotions_path, 'r') as src, open(config_promotions_path, 'w') as dst:
-                content = json.load(src)
-                json.dump(content, dst, indent=4)
-                logger.info(f"Copied promotions.json from repo to {config_promotions_path}")
+            save_json(config_promotions_path, load_json_cached(repo_promotions_path))
+            logger.info(f"Copied promotions.json from repo to {config_promotions_path}")
         else:
             # Create default
-            with open(config_promotions_path, 'w') as f:
-                json.dump({"promotions": []}, f, indent=4)
-                logger.info(f"Created default promotions.json at {config_promotions_path}")
+            save_json(config_promotions_path, dict(_DEFAULT_PROMOS))
+            logger.info(f"Created default promotions.json at {config_promotions_path}")
+    
+    marker_path.touch()
+
+class ImageEventHandler:
+    """watchdog event handler that reports image files in the watched folders"""
+    # inotify also reports when the writer closes the file, but a file moved in
+    # from an unwatched directory only produces 'created'; the processing queue
+    # drops the duplicate and waits for files that are still being written
+    EVENT_TYPES = ('created', 'closed', 'moved') if not (IS_WINDOWS or IS_MAC) else ('created', 'moved')
+    
+    def __init__(self, callback, folders):
+        self.callback = callback
+        self.folders = frozenset(os.path.normcase(os.path.abspath(f)) for f in folders)
+    
+    def dispatch(self, event):
+        if event.is_directory or event.event_type not in self.EVENT_TYPES:
+            return
+        # Screenshot tools often write a temp file and rename it into place
+        path = event.dest_path if event.event_type == 'moved' else event.src_path
+        if path[path.rfind('.'):].lower() not in IMAGE_EXTENSIONS:
+            return
+        # Ignore files landing in subfolders, e.g. our own moves into the
+        # category folders when one watched folder sits inside another
+        if os.path.normcase(os.path.dirname(os.path.abspath(path))) in self.folders:
+            self.callback(path)
 
 class FolderWatcher(QThread):
     new_file_detected = pyqtSignal(str)
@@ -114,159 +367,296 @@ class FolderWatcher(QThread):
     def __init__(self, folders):
         super().__init__()
         self.folders = folders
-        self.is_running = True
-        self.processed_files = set()
+        # Both the event observer and the polling fallback sleep on this, so
+        # stop() wakes them immediately instead of after the next tick
+        self._stop_event = threading.Event()
+        # Bounded LRU of files already reported; keyed on mtime and size too so
+        # a screenshot saved again under the same name is reported again
+        self._seen = collections.OrderedDict()
         self.last_check = {}
         
         # Initialize last check time for each folder
         for folder in folders:
-            self.last_check[folder] = datetime.now()
+            self.last_check[folder] = time.time()
     
     def run(self):
-        while self.is_running:
+        # Native filesystem events when watchdog is installed, polling otherwise
+        try:
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.info("watchdog not available, polling watched folders")
+            self.poll()
+            return
+        
+        observer = Observer()
+        handler = ImageEventHandler(self.new_file_detected.emit, self.folders)
+        for folder in self.folders:
+            if os.path.isdir(folder):
+                observer.schedule(handler, folder, recursive=False)
+        observer.start()
+        try:
+            self._stop_event.wait()
+        finally:
+            observer.stop()
+            observer.join()
+    
+    def poll(self):
+        """Fallback: rescan the folders every couple of seconds"""
+        # New files and their (mtime, size) from the previous sweep; a file is
+        # reported once it is unchanged across two sweeps, i.e. done being written
+        pending = {}
+        while not self._stop_event.is_set():
+            still_pending = {}
             for folder in self.folders:
                 if not os.path.exists(folder):
                     continue
                     
                 try:
-                    # Check for new files
-                    for filename in os.listdir(folder):
-                        if not self.is_running:
-                            break
+                    # Check for new files; scandir entries carry their stat
+                    # info, so this avoids a separate getmtime call per file
+                    with os.scandir(folder) as entries:
+                        for entry in entries:
+                            if self._stop_event.is_set():
+                                break
                             
-                        file_path = os.path.join(folder, filename)
-                        
-                        # Skip if not an image or already processed
-                        if not filename.lower().endswith(('.png', '.jpg', '.jpeg')):
-                            continue
-                        if file_path in self.processed_files:
-                            continue
+                            # Skip if not an image or already processed
+                            name = entry.name
+                            if name[name.rfind('.'):].lower() not in IMAGE_EXTENSIONS:
+                                continue
+                            st = entry.stat()
+                            key = (entry.path, st.st_mtime_ns, st.st_size)
+                            if key in self._seen:
+                                self._seen.move_to_end(key)
+                                continue
                             
-                        # Check if file is new since last check
-                        mod_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                        if mod_time > self.last_check[folder]:
-                            # Wait a bit to ensure file is completely written
-                            time.sleep(1)
-                            self.new_file_detected.emit(file_path)
-                            self.processed_files.add(file_path)
+                            stamp = (st.st_mtime_ns, st.st_size)
+                            if pending.get(entry.path) == stamp:
+                                self.new_file_detected.emit(entry.path)
+                                self._seen[key] = None
+                                if len(self._seen) > SEEN_FILES_CAP:
+                                    self._seen.popitem(last=False)
+                            # New since last check, or still being written
+                            elif entry.path in pending or st.st_mtime > self.last_check[folder]:
+                                still_pending[entry.path] = stamp
                     
                     # Update last check time
-                    self.last_check[folder] = datetime.now()
+                    self.last_check[folder] = time.time()
                     
                 except Exception as e:
                     logger.error(f"Error watching folder {folder}: {str(e)}")
                     continue
             
+            pending = still_pending
             # Sleep before next check
-            time.sleep(2)
+            self._stop_event.wait(2)
     
     def stop(self):
-        self.is_running = False
+        self._stop_event.set()
 
 
-class ProcessingThread(QThread):
+class ProcessingSignals(QObject):
+    """Signals for ProcessingJob; QRunnable itself cannot emit them"""
     progress = pyqtSignal(str)
     finished = pyqtSignal()
     error = pyqtSignal(str)
-    stats_updated = pyqtSignal(dict)
-    
+    done = pyqtSignal()  # emitted whenever run() returns, stopped or not
+
+class ProcessingJob(QRunnable):
+    """Sweep and then watch the configured folders on a pooled thread"""
     def __init__(self, folders):
         super().__init__()
+        # MainWindow keeps the reference; don't let Qt delete the wrapped object
+        self.setAutoDelete(False)
+        self.signals = ProcessingSignals()
         self.folders = folders
-        self.is_running = True
-        self.queue = []
-        self.queue_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._done = threading.Event()
+        self.session = None  # shared HTTP session, created in run()
+        # Files reported by the watcher; the set mirrors the deque for O(1)
+        # duplicate checks and the event wakes the consumer loop
+        self.queue = collections.deque()
+        self._queued = set()
+        self._queue_lock = threading.Lock()
+        self._queue_event = threading.Event()
+        
+        # Progress messages are throttled; the latest skipped one is kept for flushing
+        self._progress_lock = threading.Lock()
+        self._last_emit = 0.0
+        self._pending_msg = None
     
     def add_to_queue(self, file_path):
         """Add a file to the processing queue"""
-        with self.queue_lock:
-            if file_path not in self.queue:
-                self.queue.append(file_path)
+        with self._queue_lock:
+            if file_path in self._queued:
+                return
+            self._queued.add(file_path)
+            self.queue.append(file_path)
+        self._queue_event.set()
+    
+    def emit_progress(self, message):
+        """Emit progress at most every PROGRESS_INTERVAL seconds, keeping the latest"""
+        with self._progress_lock:
+            now = time.monotonic()
+            if now - self._last_emit < PROGRESS_INTERVAL:
+                self._pending_msg = message
+                return
+            self._last_emit = now
+            self._pending_msg = None
+        self.signals.progress.emit(message)
+    
+    def flush_progress(self):
+        """Emit the last throttled progress message, if any"""
+        with self._progress_lock:
+            message, self._pending_msg = self._pending_msg, None
+            self._last_emit = time.monotonic()
+        if message is not None:
+            self.signals.progress.emit(message)
+    
+    def process_folder(self, folder):
+        """Run the initial sweep over a single folder"""
+        from screenshot_organizer import process_screenshots
+        
+        if self._stop.is_set():
+            return
+            
+        # A single stat tells us whether the folder is reachable
+        try:
+            os.stat(folder)
+        except OSError:
+            self.signals.error.emit(f"Folder not found: {folder}")
+            return
+        
+        self.emit_progress(f"Processing existing files in: {folder}")
+        try:
+            process_screenshots(folder, callback=self.process_callback, cancel=self._stop,
+                                session=self.session)
+        except Exception as e:
+            self.signals.error.emit(f"Error processing folder {folder}: {str(e)}")
+            logger.exception("Error processing folder %s", folder)
     
     def run(self):
         try:
-            # Initial processing of existing files
-            for folder in self.folders:
-                if not self.is_running:
-                    break
-                    
-                if not os.path.exists(folder):
-                    self.error.emit(f"Folder not found: {folder}")
-                    continue
-                
-                self.progress.emit(f"Processing existing files in: {folder}")
-                try:
-                    process_screenshots(folder, callback=self.process_callback)
-                except Exception as e:
-                    self.error.emit(f"Error processing folder {folder}: {str(e)}")
-                    logger.error(f"Error processing folder {folder}: {str(e)}")
-                    logger.error(traceback.format_exc())
-                    continue
+            # Imported here so the GUI can paint before the AI stack loads
+            from screenshot_organizer import process_screenshots, make_session
+            
+            # One connection pool for every folder and every file this run
+            self.session = make_session()
+            
+            # Initial processing of existing files; folders are independent and
+            # mostly waiting on the AI provider, so sweep them concurrently.
+            # Threads rather than processes: the sweep releases the GIL while it
+            # waits on HTTP, and it reports back through callbacks and the stop event
+            if self.folders:
+                pool = get_folder_pool()
+                for folder in unique_folders(self.folders):
+                    pool.start(partial(self.process_folder, folder))
+                pool.waitForDone()
+                self.flush_progress()
             
-            # Start watching for new files
+            # Start watching for new files; pool threads have no event loop, so
+            # take the (lock-protected) queue append directly on the watcher thread
             self.watcher = FolderWatcher(self.folders)
-            self.watcher.new_file_detected.connect(self.add_to_queue)
+            self.watcher.new_file_detected.connect(self.add_to_queue, Qt.ConnectionType.DirectConnection)
             self.watcher.start()
             
-            # Process queue
-            while self.is_running:
-                with self.queue_lock:
-                    if self.queue:
-                        file_path = self.queue.pop(0)
-                        folder = os.path.dirname(file_path)
-                        try:
-                            process_screenshots(folder, callback=self.process_callback)
-                        except Exception as e:
-                            self.error.emit(f"Error processing file {file_path}: {str(e)}")
-                            logger.error(f"Error processing file {file_path}: {str(e)}")
-                            logger.error(traceback.format_exc())
+            # Process queue; sleep until the watcher reports a file or stop() is called
+            while not self._stop.is_set():
+                self._queue_event.wait()
+                # Let screenshot tools finish a burst so it becomes one sweep
+                if self._stop.wait(QUEUE_DEBOUNCE):
+                    break
+                self._queue_event.clear()
+                
+                # process_screenshots sweeps a whole folder, so drain the queue
+                # and run it once per folder rather than once per file
+                with self._queue_lock:
+                    batch = list(self.queue)
+                    self.queue.clear()
+                    self._queued.clear()
+                
+                # Creation events arrive while the file is still being written;
+                # hold back a folder until its files have stopped changing
+                now = time.time()
+                ready = {}
+                for path in batch:
+                    try:
+                        mtime = os.stat(path).st_mtime
+                    except OSError:
+                        continue  # already moved, e.g. by the sweep an earlier event started
+                    folder = os.path.dirname(path)
+                    ready[folder] = ready.get(folder, True) and now - mtime >= QUEUE_DEBOUNCE
+                for path in batch:
+                    if ready.get(os.path.dirname(path)) is False:
+                        self.add_to_queue(path)
+                folders_to_process = [folder for folder, ok in ready.items() if ok]
                 
-                time.sleep(1)  # Prevent CPU overuse
+                for folder in folders_to_process:
+                    if self._stop.is_set():
+                        break
+                    try:
+                        process_screenshots(folder, callback=self.process_callback, cancel=self._stop,
+                                            session=self.session)
+                    except Exception as e:
+                        self.signals.error.emit(f"Error processing folder {folder}: {str(e)}")
+                        logger.exception("Error processing folder %s", folder)
+                
+                self.flush_progress()
             
             # Stop the watcher
             if hasattr(self, 'watcher'):
                 self.watcher.stop()
                 self.watcher.wait()
             
-            if self.is_running:  # Only emit finished if not stopped
-                self.finished.emit()
+            if not self._stop.is_set():  # Only emit finished if not stopped
+                self.signals.finished.emit()
                 
         except Exception as e:
             error_msg = f"Error during processing: {str(e)}"
-            logger.error(error_msg)
-            logger.error(traceback.format_exc())
-            self.error.emit(error_msg)
+            logger.exception(error_msg)
+            self.signals.error.emit(error_msg)
+        finally:
+            # None if the import or make_session() failed
+            if self.session is not None:
+                self.session.close()
+                self.session = None
+            self._done.set()
+            self.signals.done.emit()
+    
+    def isRunning(self):
+        return not self._done.is_set()
+    
+    def wait(self, timeout_ms=None):
+        """Block until run() returns; True if it did within the timeout"""
+        return self._done.wait(None if timeout_ms is None else timeout_ms / 1000)
     
     def process_callback(self, data):
         """Callback for processing updates"""
-        if not self.is_running:
+        if self._stop.is_set():
             return False
             
         if isinstance(data, dict):
             status = data.get('status', '')
             
             if status == 'error':
-                self.error.emit(data.get('error', 'Unknown error'))
+                self.signals.error.emit(data.get('error', 'Unknown error'))
             elif status == 'processing':
-                self.progress.emit(f"Processed: {data['file']} -> {data['category']}/{data['subcategory']}")
+                self.emit_progress(f"Processed: {data['file']} -> {data['category']}/{data['subcategory']}")
             elif status == 'checking':
-                self.progress.emit("Checking for new files...")
+                self.emit_progress("Checking for new files...")
             elif status == 'complete':
-                self.progress.emit("Processing complete")
-            
-            if 'stats' in data:
-                # Convert set to list for JSON serialization
-                stats = data['stats'].copy()
-                if isinstance(stats.get('categories_created'), set):
-                    stats['categories_created'] = list(stats['categories_created'])
-                self.stats_updated.emit(stats)
+                self.emit_progress("Processing complete")
         
-        return self.is_running
+        return not self._stop.is_set()
     
     def stop(self):
         """Stop processing"""
         logger.info("Stopping processing...")
-        self.is_running = False
+        self._stop.set()
+        self._queue_event.set()  # wake the consumer loop so it sees the stop
+        # A describe thread blocked reading a provider reply won't see the stop
+        # until the read returns; drop the connection so it returns now
+        if 'screenshot_organizer' in sys.modules:
+            sys.modules['screenshot_organizer'].abort_open_requests()
 
 
 class SettingsWidget(QWidget):
@@ -281,43 +671,10 @@ class SettingsWidget(QWidget):
 
         # Provider Selection
         provider_group = QWidget()
-        provider_group.setStyleSheet("""
-            QWidget {
-                background-color: #FFFFFF;
-                border: 1px solid #BBDEFB;
-                border-radius: 10px;
-                padding: 15px;
-            }
-            QLabel {
-                color: #1565C0;
-            }
-            QComboBox {
-                padding: 8px;
-                border: 1px solid #BBDEFB;
-                border-radius: 4px;
-                min-width: 200px;
-                color: #424242;
-                background-color: white;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: url(down_arrow.png);
-                width: 12px;
-                height: 12px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: white;
-                color: #424242;
-                selection-background-color: #E3F2FD;
-                selection-color: #1565C0;
-            }
-        """)
+        provider_group.setObjectName("settingsCard")
         provider_layout = QVBoxLayout(provider_group)
 
-        provider_label = QLabel("AI Provider:")
-        provider_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        provider_label = make_field_label("AI Provider:")
         provider_layout.addWidget(provider_label)
 
         self.provider_combo = QComboBox()
@@ -329,69 +686,28 @@ class SettingsWidget(QWidget):
 
         # Model Settings
         model_group = QWidget()
-        model_group.setStyleSheet("""
-            QWidget {
-                background-color: #FFFFFF;
-                border: 1px solid #BBDEFB;
-                border-radius: 10px;
-                padding: 15px;
-            }
-            QLabel {
-                color: #1565C0;
-            }
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #BBDEFB;
-                border-radius: 4px;
-                color: #424242;
-                background-color: white;
-            }
-        """)
+        model_group.setObjectName("settingsCard")
         model_layout = QVBoxLayout(model_group)
 
         # Model Name
-        model_label = QLabel("Model Name:")
-        model_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        model_label = make_field_label("Model Name:")
         model_layout.addWidget(model_label)
 
         self.model_input = QLineEdit()
         model_layout.addWidget(self.model_input)
 
-        # Base URL
-        url_label = QLabel("Base URL:")
-        url_label.setStyleSheet("font-size: 16px; font-weight: bold;")
-        model_layout.addWidget(url_label)
-
-        self.url_input = QLineEdit()
-        model_layout.addWidget(self.url_input)
-
-        # API Key
-        api_label = QLabel("API Key:")
-        api_label.setStyleSheet("font-size: 16px; font-weight: bold;")
-        model_layout.addWidget(api_label)
-
-        self.api_input = QLineEdit()
-        self.api_input.setEchoMode(QLineEdit.EchoMode.Password)
-        model_layout.addWidget(self.api_input)
+        # Base URL and API key, one stacked page per provider so switching
+        # providers is a single page flip and keeps each provider's values
+        self.provider_stack = QStackedWidget()
+        self.together_url_input, self.together_api_input = self.add_provider_page()
+        self.ollama_url_input, self.ollama_api_input = self.add_provider_page()
+        model_layout.addWidget(self.provider_stack)
 
         layout.addWidget(model_group)
 
         # Save Button
         save_btn = QPushButton("Save Settings")
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        save_btn.setObjectName("saveButton")
         save_btn.clicked.connect(self.save_settings)
         layout.addWidget(save_btn)
 
@@ -401,57 +717,82 @@ class SettingsWidget(QWidget):
         # Load existing settings
         self.load_settings()
 
+    def add_provider_page(self):
+        """Add a Base URL / API Key page to the provider stack"""
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Base URL
+        url_label = make_field_label("Base URL:")
+        page_layout.addWidget(url_label)
+
+        url_input = QLineEdit()
+        page_layout.addWidget(url_input)
+
+        # API Key
+        api_label = make_field_label("API Key:")
+        page_layout.addWidget(api_label)
+
+        api_input = QLineEdit()
+        api_input.setEchoMode(QLineEdit.EchoMode.Password)
+        page_layout.addWidget(api_input)
+
+        self.provider_stack.addWidget(page)
+        return url_input, api_input
+
     def load_settings(self):
         try:
             settings_path = get_config_path('settings.json')
             if os.path.exists(settings_path):
-                with open(settings_path, 'r') as f:
-                    settings = json.load(f)
+                settings = load_json_cached(settings_path)
                     
                 self.provider_combo.setCurrentText(settings.get('provider', 'Together AI'))
                 self.model_input.setText(settings.get('model', ''))
                 
-                # Set URL based on provider
-                if settings['provider'] == 'Together AI':
-                    self.url_input.setText(settings.get('together_url', 'https://api.together.xyz'))
-                    self.api_input.setText(settings.get('together_api_key', ''))
-                else:
-                    self.url_input.setText(settings.get('ollama_url', 'http://localhost:11434'))
-                    self.api_input.setText(settings.get('ollama_api_key', ''))
+                self.together_url_input.setText(settings.get('together_url', 'https://api.together.xyz'))
+                self.together_api_input.setText(settings.get('together_api_key', ''))
+                self.ollama_url_input.setText(settings.get('ollama_url', 'http://localhost:11434'))
+                self.ollama_api_input.setText(settings.get('ollama_api_key', ''))
                     
         except Exception as e:
             logger.error(f"Error loading settings: {str(e)}")
-            QMessageBox.warning(self, "Error", "Could not load settings. Using defaults.")
+            show_message(self, QMessageBox.Icon.Warning, "Error", "Could not load settings. Using defaults.")
 
     def save_settings(self):
         try:
             settings = {
                 'provider': self.provider_combo.currentText(),
                 'model': self.model_input.text(),
-                'together_url': self.url_input.text() if self.provider_combo.currentText() == 'Together AI' else 'https://api.together.xyz',
-                'together_api_key': self.api_input.text() if self.provider_combo.currentText() == 'Together AI' else '',
-                'ollama_url': self.url_input.text() if self.provider_combo.currentText() == 'Ollama' else 'http://localhost:11434',
-                'ollama_api_key': self.api_input.text() if self.provider_combo.currentText() == 'Ollama' else ''
+                'together_url': self.together_url_input.text(),
+                'together_api_key': self.together_api_input.text(),
+                'ollama_url': self.ollama_url_input.text(),
+                'ollama_api_key': self.ollama_api_input.text()
             }
             
-            settings_path = get_config_path('settings.json')
-            with open(settings_path, 'w') as f:
-                json.dump(settings, f, indent=4)
+            # Stats live in the same file, so carry them over from the cached copy
+            config_path = get_config_path('settings.json')
+            try:
+                stats = load_json_cached(config_path).get('stats')
+            except (FileNotFoundError, ValueError):
+                stats = None
+            if stats is not None:
+                settings['stats'] = stats
+            
+            save_json(config_path, settings)
             
-            QMessageBox.information(self, "Success", "Settings saved successfully!")
+            show_message(self, QMessageBox.Icon.Information, "Success", "Settings saved successfully!")
             
         except Exception as e:
             logger.error(f"Error saving settings: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Could not save settings: {str(e)}")
+            show_message(self, QMessageBox.Icon.Critical, "Error", f"Could not save settings: {str(e)}")
 
     def on_provider_changed(self, provider):
         if provider == "Together AI":
             self.model_input.setText("Llama-3.2-11B-Vision-Instruct-Turbo")
-            self.url_input.setText("https://api.together.xyz")
         else:
             self.model_input.setText("llama2-vision")
-            self.url_input.setText("http://localhost:11434")
-        self.api_input.clear()
+        self.provider_stack.setCurrentIndex(0 if provider == "Together AI" else 1)
 
 class FolderWidget(QWidget):
     def __init__(self):
@@ -463,20 +804,19 @@ class FolderWidget(QWidget):
     def initUI(self):
         layout = QVBoxLayout()
         
-        # Folder selection buttons and labels
+        # Folder selection buttons and labels, one grid row per folder
+        grid = QGridLayout()
         self.folder_layouts = []
-        for i in range(3):
-            h_layout = QHBoxLayout()
-            label = QLabel(f"Folder {i+1}:")
+        for i in range(MAX_FOLDERS):
             path_label = QLabel("No folder selected")
             browse_btn = QPushButton("Browse")
-            browse_btn.clicked.connect(lambda checked, x=i: self.browseFolderPath(x))
+            browse_btn.clicked.connect(partial(self.browseFolderPath, i))
             
-            h_layout.addWidget(label)
-            h_layout.addWidget(path_label)
-            h_layout.addWidget(browse_btn)
-            layout.addLayout(h_layout)
+            grid.addWidget(QLabel(f"Folder {i+1}:"), i, 0)
+            grid.addWidget(path_label, i, 1)
+            grid.addWidget(browse_btn, i, 2)
             self.folder_layouts.append((path_label, browse_btn))
+        layout.addLayout(grid)
 
         # Save button
         save_btn = QPushButton("Save Folders")
@@ -485,8 +825,16 @@ class FolderWidget(QWidget):
 
         self.setLayout(layout)
 
-    def browseFolderPath(self, index):
-        folder = QFileDialog.getExistingDirectory(self, "Select Folder")
+    def browseFolderPath(self, index, checked=False):
+        # Opened window-modal so the event loop (and processing progress) keeps running
+        dialog = QFileDialog(self, "Select Folder")
+        dialog.setFileMode(QFileDialog.FileMode.Directory)
+        dialog.setOption(QFileDialog.Option.ShowDirsOnly)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(partial(self.setFolderPath, index))
+        dialog.open()
+
+    def setFolderPath(self, index, folder):
         if folder:
             if index >= len(self.folders):
                 self.folders.append(folder)
@@ -497,22 +845,33 @@ class FolderWidget(QWidget):
     def loadFolders(self):
         config_path = get_config_path('folders.json')
         if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                self.folders = json.load(f)
-                for i, folder in enumerate(self.folders[:3]):
-                    self.folder_layouts[i][0].setText(folder)
+            # Copy so browsing doesn't mutate the cached list
+            self.folders = list(load_json_cached(config_path))
+            for i, folder in enumerate(self.folders[:MAX_FOLDERS]):
+                self.folder_layouts[i][0].setText(folder)
 
     def saveFolders(self):
-        config_path = get_config_path('folders.json')
-        with open(config_path, 'w') as f:
-            json.dump(self.folders, f)
-        QMessageBox.information(self, "Success", "Folders saved successfully!")
+        save_json(get_config_path('folders.json'), list(self.folders), indent=None)
+        show_message(self, QMessageBox.Icon.Information, "Success", "Folders saved successfully!")
 
 class DashboardWidget(QWidget):
+    # Carries saved settings to showStats; queued when the save came from a worker
+    settings_saved = pyqtSignal(object)
+    
     def __init__(self):
         super().__init__()
+        self._shown_settings = None
         self.initUI()
         self.loadStats()
+        
+        # Coalesce bursts of refresh requests (e.g. one per processed file) into one read
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.loadStats)
+        
+        # Settings saves hand us the new dict directly, no need to re-read the file
+        self.settings_saved.connect(self.showStats)
+        add_save_listener(get_config_path('settings.json'), self.settings_saved.emit)
 
     def initUI(self):
         # Create a scroll area
@@ -526,101 +885,56 @@ class DashboardWidget(QWidget):
         layout.setSpacing(15)
         layout.setContentsMargins(20, 20, 20, 20)
 
-        # Welcome Section
-        welcome_widget = QWidget()
-        welcome_layout = QVBoxLayout()
-        welcome_widget.setLayout(welcome_layout)
-        welcome_widget.setStyleSheet("""
-            QWidget {
-                background-color: #E3F2FD;
-                border: 1px solid #90CAF9;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
-
-        # Title and creator in one row
-        title_layout = QHBoxLayout()
+        # Welcome Section: title and creator in one row
+        welcome_card = QFrame()
+        welcome_card.setObjectName("welcomeCard")
+        welcome_layout = QHBoxLayout(welcome_card)
         
         title = QLabel("Welcome to Screenshot Organizer")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; color: #1565C0;")
-        title_layout.addWidget(title)
-        
-        creator_layout = QHBoxLayout()
-        creator_layout.setSpacing(5)
+        title.setObjectName("dashboardTitle")
+        welcome_layout.addWidget(title)
         
         by_label = QLabel("by")
-        by_label.setStyleSheet("color: #666; font-size: 14px;")
-        creator_layout.addWidget(by_label)
+        by_label.setObjectName("byLabel")
+        welcome_layout.addWidget(by_label)
         
         channel_label = QLabel("kno2gether")
-        channel_label.setStyleSheet("color: #1565C0; font-size: 14px; font-weight: bold;")
-        creator_layout.addWidget(channel_label)
+        channel_label.setObjectName("channelLabel")
+        welcome_layout.addWidget(channel_label)
         
         youtube_btn = QPushButton("Subscribe")
-        youtube_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF0000;
-                color: white;
-                padding: 4px 12px;
-                border: none;
-                border-radius: 3px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #CC0000;
-            }
-        """)
+        youtube_btn.setObjectName("subscribeButton")
         youtube_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        youtube_btn.clicked.connect(lambda: webbrowser.open('https://www.youtube.com/channel/UCxgkN3luQgLQOd_L7tbOdhQ/join'))
-        creator_layout.addWidget(youtube_btn)
+        youtube_btn.clicked.connect(self.open_youtube)
+        welcome_layout.addWidget(youtube_btn)
         
-        creator_layout.addStretch()
-        title_layout.addLayout(creator_layout)
-        welcome_layout.addLayout(title_layout)
+        welcome_layout.addStretch()
 
-        layout.addWidget(welcome_widget)
+        layout.addWidget(welcome_card)
 
         # Stats Section
-        stats_widget = QWidget()
-        stats_layout = QVBoxLayout()
-        stats_widget.setLayout(stats_layout)
-        stats_widget.setStyleSheet("""
-            QWidget {
-                background-color: #FFFFFF;
-                border: 1px solid #BBDEFB;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        stats_card = QFrame()
+        stats_card.setObjectName("statsCard")
+        stats_layout = QVBoxLayout(stats_card)
 
         stats_title = QLabel("Statistics")
-        stats_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #1565C0;")
+        stats_title.setObjectName("statsTitle")
         stats_layout.addWidget(stats_title)
 
         self.stats_label = QLabel()
         self.stats_label.setWordWrap(True)
-        self.stats_label.setStyleSheet("font-size: 14px; line-height: 1.4; color: #424242;")
+        self.stats_label.setObjectName("statsLabel")
         stats_layout.addWidget(self.stats_label)
 
-        layout.addWidget(stats_widget)
+        layout.addWidget(stats_card)
 
         # Getting Started Section
-        guide_widget = QWidget()
-        guide_layout = QVBoxLayout()
-        guide_widget.setLayout(guide_layout)
-        guide_widget.setStyleSheet("""
-            QWidget {
-                background-color: #FFF3E0;
-                border: 1px solid #FFE0B2;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        guide_card = QFrame()
+        guide_card.setObjectName("guideCard")
+        guide_layout = QVBoxLayout(guide_card)
 
         guide_title = QLabel("Getting Started")
-        guide_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #E65100;")
+        guide_title.setObjectName("guideTitle")
         guide_layout.addWidget(guide_title)
 
         steps = [
@@ -630,28 +944,23 @@ class DashboardWidget(QWidget):
             "4. Click Start Processing to begin organizing your screenshots"
         ]
         
-        for step in steps:
-            step_label = QLabel(step)
-            step_label.setStyleSheet("font-size: 14px; margin: 3px 0; color: #424242;")
-            guide_layout.addWidget(step_label)
+        # One rich-text label for all steps instead of a label per step; Qt
+        # style sheets ignore line-height, so the spacing lives in the HTML
+        steps_label = QLabel("".join(f'<p style="margin-bottom: 8px">{step}</p>' for step in steps))
+        steps_label.setTextFormat(Qt.TextFormat.RichText)
+        steps_label.setWordWrap(True)
+        steps_label.setObjectName("guideStep")
+        guide_layout.addWidget(steps_label)
 
-        layout.addWidget(guide_widget)
+        layout.addWidget(guide_card)
 
         # Consent Section
-        consent_widget = QWidget()
-        consent_layout = QVBoxLayout()
-        consent_widget.setLayout(consent_layout)
-        consent_widget.setStyleSheet("""
-            QWidget {
-                background-color: #FFEBEE;
-                border: 1px solid #FFCDD2;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        consent_card = QFrame()
+        consent_card.setObjectName("consentCard")
+        consent_layout = QVBoxLayout(consent_card)
 
         consent_title = QLabel("Processing Consent")
-        consent_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #C62828;")
+        consent_title.setObjectName("consentTitle")
         consent_layout.addWidget(consent_title)
 
         self.consent_checkbox = QCheckBox(
@@ -659,29 +968,12 @@ class DashboardWidget(QWidget):
             "• Sending screenshots to AI services for processing\n"
             "• Allowing the app to organize files into subfolders"
         )
-        self.consent_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-size: 14px;
-                line-height: 1.4;
-                color: #424242;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 2px solid #C62828;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #C62828;
-                border: 2px solid #C62828;
-                border-radius: 3px;
-            }
-        """)
+        self.consent_checkbox.setObjectName("consentCheckbox")
+        self._consent = False
+        self.consent_checkbox.toggled.connect(self.setConsent)
         consent_layout.addWidget(self.consent_checkbox)
 
-        layout.addWidget(consent_widget)
+        layout.addWidget(consent_card)
         
         # Set the main widget as the scroll area's widget
         scroll.setWidget(main_widget)
@@ -693,39 +985,62 @@ class DashboardWidget(QWidget):
         
         self.setLayout(final_layout)
 
+    def open_youtube(self):
+        open_url('https://www.youtube.com/channel/UCxgkN3luQgLQOd_L7tbOdhQ/join')
+
+    def requestRefresh(self):
+        """Schedule a stats reload, merging repeated requests into one"""
+        self._refresh_timer.start(50)
+
     def loadStats(self):
-        config_path = get_config_path('settings.json')
         try:
-            with open(config_path, 'r') as f:
-                settings = json.load(f)
-                stats = settings.get('stats', {})
-                
-                total_images = stats.get('total_images_processed', 0)
-                last_processed = stats.get('last_processed_date')
-                categories = stats.get('categories_created', [])
-                
-                if total_images == 0:
-                    stats_text = "No images have been processed yet.\n\nFollow the Getting Started guide below to begin organizing your screenshots!"
-                else:
-                    stats_text = f"Total Images Processed: {total_images}\n"
-                    if last_processed:
-                        stats_text += f"Last Processed: {last_processed}\n"
-                    if categories:
-                        stats_text += f"Categories Created: {', '.join(categories)}"
-                
-                self.stats_label.setText(stats_text)
+            settings = load_json_cached(get_config_path('settings.json'))
         except Exception as e:
+            settings = None
+        self.showStats(settings)
+
+    def showStats(self, settings):
+        """Render the stats section from an already-loaded settings dict"""
+        # The config cache hands back the same object until the file's mtime
+        # changes, so an identical object means there is nothing new to render
+        if settings is not None and settings is self._shown_settings:
+            return
+        self._shown_settings = settings
+        
+        if not isinstance(settings, dict):
             self.stats_label.setText("No processing history available.\n\nFollow the Getting Started guide below to begin organizing your screenshots!")
+            return
+        
+        stats = settings.get('stats', {})
+        
+        total_images = stats.get('total_images_processed', 0)
+        last_processed = stats.get('last_processed_date')
+        categories = stats.get('categories_created', [])
+        
+        if total_images == 0:
+            stats_text = "No images have been processed yet.\n\nFollow the Getting Started guide below to begin organizing your screenshots!"
+        else:
+            stats_text = f"Total Images Processed: {total_images}\n"
+            if last_processed:
+                stats_text += f"Last Processed: {last_processed}\n"
+            if categories:
+                stats_text += f"Categories Created: {', '.join(categories)}"
+        
+        self.stats_label.setText(stats_text)
 
     def hasConsent(self):
-        return self.consent_checkbox.isChecked()
+        return self._consent
+
+    def setConsent(self, checked):
+        self._consent = checked
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         
-        # Initialize configuration files first
-        initialize_config_files()
+        # Window activation only checks promotions after the startup check, so
+        # the first show doesn't open a promotion straight away
+        self._promo_armed = False
         
         # Initialize user manager and check registration
         self.user_manager = UserManager()
@@ -733,15 +1048,42 @@ class MainWindow(QMainWindow):
             sys.exit()
             
         self.initUI()
-        self.processing_thread = None
+        self.processing_job = None
+        
+        # Parsed promotion date ranges, rebuilt when promotions.json changes
+        self._promo_source = None
+        self._promo_windows = []
         
-        # Set up promotional timer
-        self.promo_timer = QTimer()
-        self.promo_timer.timeout.connect(self.check_promotions)
-        self.promo_timer.start(3600000)  # Check every hour
+        # Reload config files only when they actually change on disk
+        self.config_watcher = QFileSystemWatcher([
+            get_config_path('settings.json'),
+            get_config_path('folders.json'),
+            get_config_path('promotions.json')
+        ], self)
+        self.config_watcher.fileChanged.connect(self.on_config_changed)
         
+        # Promotions are re-checked when promotions.json changes, when the user
+        # brings the window forward and after a processing run, not on a timer
         # Check promotions on startup (delayed by 5 seconds)
-        QTimer.singleShot(5000, self.check_promotions)
+        QTimer.singleShot(5000, self.startup_promo_check)
+        
+        # Built on the first processing error, then reused
+        self._error_box = None
+        # Built for the first promotion shown, then re-filled for later ones
+        self._promo_dialog = None
+
+    def on_config_changed(self, path):
+        """Invalidate cached config and refresh whatever depends on it"""
+        invalidate_cached(path)
+        
+        # Atomic saves replace the file, which drops it from the watcher
+        if path not in self.config_watcher.files() and os.path.exists(path):
+            self.config_watcher.addPath(path)
+        
+        if path == get_config_path('settings.json'):
+            self.dashboard_widget.requestRefresh()
+        elif path == get_config_path('promotions.json'):
+            QTimer.singleShot(0, self.check_promotions)
 
     def check_registration(self):
         """Check if user is registered, if not show registration dialog"""
@@ -754,45 +1096,64 @@ class MainWindow(QMainWindow):
             return False
         return True
 
+    def startup_promo_check(self):
+        self._promo_armed = True
+        self.check_promotions()
+
     def check_promotions(self):
         if not self.user_manager.should_show_promo():
             return
             
         try:
-            config_path = get_config_path('promotions.json')
-            with open(config_path, 'r') as f:
-                promo_data = json.load(f)
-                
-            for promo in promo_data.get('promotions', []):
+            promo_data = load_json_cached(get_config_path('promotions.json'))
+            
+            # Parse the promotion dates once per version of promotions.json
+            if promo_data is not self._promo_source:
+                self._promo_windows = [
+                    (date.fromisoformat(promo['start_date']),
+                     date.fromisoformat(promo['end_date']),
+                     promo)
+                    for promo in promo_data.get('promotions', [])
+                ]
+                self._promo_source = promo_data
+            
+            today = date.today()
+            for start_date, end_date, promo in self._promo_windows:
                 # Check if promotion is currently active
-                start_date = datetime.strptime(promo['start_date'], '%Y-%m-%d')
-                end_date = datetime.strptime(promo['end_date'], '%Y-%m-%d')
-                current_date = datetime.now()
-                
-                if start_date <= current_date <= end_date:
-                    show_promotional_message(self, promo)
+                if start_date <= today <= end_date:
+                    if self._promo_dialog is None:
+                        self._promo_dialog = PromotionalDialog(self)
+                    self._promo_dialog.setPromo(promo)
+                    self._promo_dialog.open()
                     self.user_manager.record_promo_shown(promo['id'])
                     break  # Show only one promotion at a time
-        except Exception as e:
-            print(f"Error showing promotion: {e}")
+        except Exception:
+            logger.exception("Error showing promotion")
 
     def initUI(self):
         self.setWindowTitle("Screenshot Organizer")
+        self.setWindowIcon(get_app_icon())
         self.setMinimumSize(800, 600)
         
         # Create tab widget
         self.tab_widget = QTabWidget()
         self.setCentralWidget(self.tab_widget)
         
-        # Initialize widgets
+        # Initialize widgets; only the dashboard is shown first, so the
+        # other pages are built the first time their tab is opened
         self.dashboard_widget = DashboardWidget()
-        self.settings_widget = SettingsWidget()
-        self.folder_widget = FolderWidget()
+        self.settings_widget = None
+        self.folder_widget = None
+        self._lazy_pages = {
+            1: ('settings_widget', SettingsWidget),
+            2: ('folder_widget', FolderWidget)
+        }
         
         # Add tabs
         self.tab_widget.addTab(self.dashboard_widget, "Dashboard")
-        self.tab_widget.addTab(self.settings_widget, "Settings")
-        self.tab_widget.addTab(self.folder_widget, "Folders")
+        self.tab_widget.addTab(QWidget(), "Settings")
+        self.tab_widget.addTab(QWidget(), "Folders")
+        self.tab_widget.currentChanged.connect(self.ensurePage)
         
         # Status bar for processing status
         self.status_label = QLabel("")
@@ -801,20 +1162,48 @@ class MainWindow(QMainWindow):
         # Processing control buttons
         self.setup_control_buttons()
         
-        # Initialize processing thread
-        self.processing_thread = None
-        
-        # Load initial stats
-        self.dashboard_widget.loadStats()
+        # Initialize processing job
+        self.processing_job = None
         
         # Setup system tray
         self.setupSystemTray()
 
+    def ensurePage(self, index):
+        """Swap a tab's placeholder for its real page on first use"""
+        if index not in self._lazy_pages:
+            return
+            
+        attr, page_class = self._lazy_pages.pop(index)
+        page = page_class()
+        setattr(self, attr, page)
+        
+        placeholder = self.tab_widget.widget(index)
+        title = self.tab_widget.tabText(index)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, page, title)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+    def switchPage(self, index):
+        """Show the page at index, building it if needed"""
+        self.tab_widget.setCurrentIndex(index)
+        if index == 0:
+            self.dashboard_widget.requestRefresh()
+
     def setupSystemTray(self):
         """Setup system tray icon and menu"""
         self.tray_icon = QSystemTrayIcon(self)
-        icon = QIcon("icon.png")
-        self.tray_icon.setIcon(icon)
+        self.tray_icon.setIcon(get_app_icon())
+        
+        # Arguments for the notice shown each time the window is closed to the tray
+        self._tray_hide_message = (
+            "Screenshot Organizer",
+            "Application will keep running in the system tray",
+            QSystemTrayIcon.MessageIcon.Information,
+            2000
+        )
         
         # Create tray menu
         tray_menu = QMenu()
@@ -852,31 +1241,35 @@ class MainWindow(QMainWindow):
                 self.show()
                 self.activateWindow()
 
+    def changeEvent(self, event):
+        if (event.type() == QEvent.Type.ActivationChange and self._promo_armed
+                and self.isActiveWindow()):
+            self.check_promotions()
+        super().changeEvent(event)
+
     def closeEvent(self, event):
         """Handle window close event"""
         if self.tray_icon.isVisible():
             self.hide()
-            self.tray_icon.showMessage(
-                "Screenshot Organizer",
-                "Application will keep running in the system tray",
-                QSystemTrayIcon.MessageIcon.Information,
-                2000
-            )
+            self.tray_icon.showMessage(*self._tray_hide_message)
             event.ignore()
         else:
             self.quitApplication()
 
     def quitApplication(self):
         """Properly quit the application"""
-        # Stop processing if running
-        if self.processing_thread and self.processing_thread.isRunning():
-            self.processing_thread.stop()
-            self.processing_thread.wait()
-        
         # Remove tray icon
         if hasattr(self, 'tray_icon'):
             self.tray_icon.hide()
         
+        # Stop processing if running; quit once the job returns instead of blocking
+        # the UI on it, with a timeout in case it is stuck in a provider call
+        if self.processing_job and self.processing_job.isRunning():
+            self.processing_job.signals.done.connect(QApplication.quit, Qt.ConnectionType.QueuedConnection)
+            self.processing_job.stop()
+            QTimer.singleShot(SHUTDOWN_TIMEOUT_MS, QApplication.quit)
+            return
+        
         # Quit application
         QApplication.quit()
 
@@ -892,29 +1285,8 @@ class MainWindow(QMainWindow):
         self.stop_btn.setEnabled(False)
         
         # Style buttons
-        button_style = """
-            QPushButton {
-                background-color: #1976D2;
-                color: white;
-                padding: 8px 15px;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #1565C0;
-            }
-            QPushButton:checked {
-                background-color: #0D47A1;
-            }
-            QPushButton:disabled {
-                background-color: #BBDEFB;
-                color: #78909C;
-            }
-        """
-        self.start_btn.setStyleSheet(button_style)
-        self.stop_btn.setStyleSheet(button_style)
+        self.start_btn.setObjectName("controlButton")
+        self.stop_btn.setObjectName("controlButton")
         
         # Connect buttons
         self.start_btn.clicked.connect(self.startProcessing)
@@ -928,112 +1300,143 @@ class MainWindow(QMainWindow):
         self.statusBar().addWidget(buttons_container)
 
     def startProcessing(self):
-        if not os.path.exists(get_config_path('folders.json')):
-            QMessageBox.warning(self, "Warning", "Please configure folders first!")
-            self.tab_widget.setCurrentIndex(2)  # Switch to folders page
+        try:
+            folders = load_json_cached(get_config_path('folders.json'))
+        except FileNotFoundError:
+            show_message(self, QMessageBox.Icon.Warning, "Warning", "Please configure folders first!")
+            self.switchPage(2)  # Switch to folders page
             return
             
         if not self.dashboard_widget.hasConsent():
-            QMessageBox.warning(self, "Warning", "Please accept the AI processing consent!")
-            self.tab_widget.setCurrentIndex(0)  # Switch to dashboard page
+            show_message(self, QMessageBox.Icon.Warning, "Warning", "Please accept the AI processing consent!")
+            self.switchPage(0)  # Switch to dashboard page
             return
             
-        with open(get_config_path('folders.json'), 'r') as f:
-            folders = json.load(f)
-            
         if not folders:
-            QMessageBox.warning(self, "Warning", "No folders configured!")
-            self.tab_widget.setCurrentIndex(2)  # Switch to folders page
+            show_message(self, QMessageBox.Icon.Warning, "Warning", "No folders configured!")
+            self.switchPage(2)  # Switch to folders page
             return
             
-        self.processing_thread = ProcessingThread(folders)
-        self.processing_thread.progress.connect(self.updateStatus)
-        self.processing_thread.error.connect(self.showError)
-        self.processing_thread.finished.connect(self.processingFinished)
-        self.processing_thread.stats_updated.connect(self.updateStats)
-        self.processing_thread.start()
+        self.processing_job = ProcessingJob(folders)
+        # Always queue onto the UI thread so the worker never waits on a repaint
+        queued = Qt.ConnectionType.QueuedConnection
+        signals = self.processing_job.signals
+        signals.progress.connect(self.updateStatus, queued)
+        signals.error.connect(self.showError, queued)
+        signals.finished.connect(self.processingFinished, queued)
+        signals.done.connect(self.processingDone, queued)
+        QThreadPool.globalInstance().start(self.processing_job)
         
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
 
     def stopProcessing(self):
         """Stop the processing thread"""
-        if self.processing_thread and self.processing_thread.isRunning():
+        if self.processing_job and self.processing_job.isRunning():
             logger.info("User requested to stop processing")
-            self.processing_thread.stop()
             self.status_label.setText("Stopping processing...")
             self.stop_btn.setEnabled(False)  # Disable stop button while stopping
             
-            # Wait for the thread to finish with a timeout
-            if not self.processing_thread.wait(5000):  # 5 second timeout
-                logger.warning("Processing thread did not stop gracefully")
-                self.processing_thread.terminate()  # Force termination if necessary
-            
-            self.status_label.setText("Processing stopped by user")
-            self.start_btn.setEnabled(True)
-            logger.info("Processing stopped successfully")
+            # The job exits at its next stop check; finish up when it reports done
+            # rather than blocking the UI on it. Connected before the check below
+            # so a job that ends in between is still noticed
+            self.processing_job.signals.done.connect(self.processingStopped,
+                                                     Qt.ConnectionType.QueuedConnection)
+            self.processing_job.stop()
+            if not self.processing_job.isRunning():
+                self.processingStopped()
+
+    def processingStopped(self):
+        self.status_label.setText("Processing stopped by user")
+        self.start_btn.setEnabled(True)
+        logger.info("Processing stopped successfully")
+
+    def processingDone(self):
+        """Re-enable Start once the job has returned, however it ended"""
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
 
     def updateStatus(self, message):
         self.status_label.setText(message)
 
     def processingFinished(self):
+        QTimer.singleShot(0, self.check_promotions)
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.status_label.setText("Processing completed")
 
     def showError(self, error_msg):
         logger.error(f"Processing error: {error_msg}")
-        QMessageBox.critical(self, "Error", error_msg)
+        # One dialog is reused for every error; open() doesn't nest event loops when
+        # errors arrive back to back, it just updates the text of the visible box
+        if self._error_box is None:
+            self._error_box = QMessageBox(self)
+            self._error_box.setIcon(QMessageBox.Icon.Critical)
+            self._error_box.setWindowTitle("Error")
+        self._error_box.setText(error_msg)
+        self._error_box.open()
+        # Per-file errors arrive while the job keeps running; the buttons are
+        # reset by processingDone once the job has actually returned
         self.status_label.setText(f"Error: {error_msg}")
-        self.start_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
 
-    def updateStats(self, stats):
-        """Update statistics in settings file"""
-        try:
-            config_path = get_config_path('settings.json')
-            with open(config_path, 'r') as f:
-                settings = json.load(f)
-            
-            # Ensure stats is a dictionary
-            if not isinstance(stats, dict):
-                logger.error(f"Invalid stats format: {stats}")
-                return
-                
-            # Convert any sets to lists
-            if isinstance(stats.get('categories_created'), set):
-                stats['categories_created'] = list(stats['categories_created'])
-            
-            # Update settings with new stats
-            if 'stats' not in settings:
-                settings['stats'] = {}
-            
-            settings['stats'].update({
-                'total_images_processed': stats.get('total_images_processed', 0),
-                'last_processed_date': stats.get('last_processed_date'),
-                'categories_created': stats.get('categories_created', [])
-            })
-            
-            # Write updated settings
-            with open(config_path, 'w') as f:
-                json.dump(settings, f, indent=4)
-            
-            # Reload dashboard stats
-            self.dashboard_widget.loadStats()
-            
-        except Exception as e:
-            logger.error(f"Error updating stats: {str(e)}")
-            logger.error(traceback.format_exc())
+def warm_up_processing():
+    """Import the screenshot processing module in the background of startup"""
+    import screenshot_organizer  # noqa: F401
+
+def setup_logging():
+    """Route all log records through a queue so handlers run off the UI thread"""
+    import logging.handlers
+    import queue
+    
+    log_dir = os.path.join(get_app_data_dir(), 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(os.path.join(log_dir, 'screenshot_organizer.log'))
+    stream_handler = logging.StreamHandler()
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    
+    # basicConfig in screenshot_organizer is a no-op once the root logger has a handler
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    return listener
 
 def main():
-    app = QApplication(sys.argv)
+    log_listener = setup_logging()
     
-    # Initialize configuration files
+    # Initialize configuration files; plain file I/O, so do it before Qt starts up
     initialize_config_files()
     
+    app = QApplication(sys.argv)
+    app.setStyleSheet(APP_QSS)
+    
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
+    
+    # Load the processing stack (PIL, requests, ...) once the window is up, on a
+    # background thread so the import doesn't stall the event loop either
+    QTimer.singleShot(0, lambda: threading.Thread(target=warm_up_processing, daemon=True).start())
+    exit_code = app.exec()
+    
+    # Give a job still unwinding a bounded wait rather than hanging on exit
+    stopped = QThreadPool.globalInstance().waitForDone(SHUTDOWN_TIMEOUT_MS)
+    if 'screenshot_organizer' in sys.modules:
+        stopped = sys.modules['screenshot_organizer'].shutdown_describe_pool(
+            SHUTDOWN_TIMEOUT_MS / 1000) and stopped
+    if not stopped:
+        logger.warning("Processing did not stop in time; exiting anyway")
+    # Last, so everything logged while shutting down is written
+    log_listener.stop()
+    if not stopped:
+        # sys.exit would join the stuck worker threads and hang
+        os._exit(exit_code)
+    sys.exit(exit_code)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,129 @@
+import os
+import json
+import platform
+import threading
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works the same
+    orjson = None
+
+# Platform-specific settings; everything else branches on these constants
+_SYSTEM = platform.system()
+IS_WINDOWS = _SYSTEM == "Windows"
+IS_MAC = _SYSTEM == "Darwin"
+
+def _compute_config_dir():
+    """Resolve the platform-specific config directory"""
+    if IS_WINDOWS:
+        return os.path.join(os.getenv('APPDATA'), 'ScreenshotOrganizer')
+    elif IS_MAC:
+        return os.path.expanduser('~/Library/Application Support/ScreenshotOrganizer')
+    else:  # Linux
+        # Keep using the old dot-directory if an existing install already has one
+        legacy_dir = os.path.expanduser('~/.screenshotorganizer')
+        if os.path.isdir(legacy_dir):
+            return legacy_dir
+        config_home = os.environ.get('XDG_CONFIG_HOME') or os.path.expanduser('~/.config')
+        return os.path.join(config_home, 'screenshotorganizer')
+
+# Resolved once per process; create it here so lookups never touch the disk
+CONFIG_DIR = _compute_config_dir()
+os.makedirs(CONFIG_DIR, exist_ok=True)
+
+def get_app_data_dir():
+    """Get the platform-specific application data directory"""
+    return CONFIG_DIR
+
+@lru_cache(maxsize=None)
+def get_config_path(filename):
+    """Get the platform-specific path for config files"""
+    return os.path.join(CONFIG_DIR, filename)
+
+def dumps_json(data, indent=4):
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed
+
+    indent=None gives compact output for files only the app reads.
+    """
+    if orjson is not None:
+        # orjson only supports two-space indentation
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if not indent:
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+    return json.dumps(data, indent=indent).encode('utf-8')
+
+def loads_json(raw):
+    """Parse JSON from bytes or str, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Parsed config files keyed by path -> (st_mtime_ns, data, raw bytes)
+_CONFIG_CACHE = {}
+
+# Callbacks notified with the new data whenever save_json writes a path
+_SAVE_LISTENERS = {}
+
+def add_save_listener(path, callback):
+    """Call callback(data) after each save of path, instead of re-reading it
+
+    data is the cached copy load_json_cached returns, so it must not be mutated.
+    """
+    _SAVE_LISTENERS.setdefault(path, []).append(callback)
+
+def load_json_cached(path):
+    """Load a JSON config file, re-parsing only when its mtime changes.
+
+    The returned object is shared between callers, so copy it before mutating.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _CONFIG_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = loads_json(raw)
+    _CONFIG_CACHE[path] = (mtime, data, raw)
+    return data
+
+def save_json(path, data, indent=4):
+    """Atomically write a JSON config file, skipping the write if unchanged.
+
+    Returns True if the file was written.
+    """
+    raw = dumps_json(data, indent=indent)
+    cached = _CONFIG_CACHE.get(path)
+    if cached and cached[2] == raw:
+        try:
+            if os.stat(path).st_mtime_ns == cached[0]:
+                return False
+        except FileNotFoundError:
+            pass
+
+    # Write to a temp file and swap it in so readers never see a partial file;
+    # the name is per-thread since the UI and the processing workers both save
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Don't leave a half-written temp file behind (e.g. on a full disk)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    # Cache a copy parsed from what was written rather than the caller's object,
+    # which the caller may keep mutating after the save
+    saved = loads_json(raw)
+    _CONFIG_CACHE[path] = (os.stat(path).st_mtime_ns, saved, raw)
+    for callback in _SAVE_LISTENERS.get(path, ()):
+        callback(saved)
+    return True
+
+def invalidate_cached(path):
+    """Drop a cached config file so the next read goes back to disk"""
+    _CONFIG_CACHE.pop(path, None)
@@ -1,5 +1,6 @@
 import os
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageDraw
 
 def create_base_icon():
@@ -21,6 +22,10 @@ def create_base_icon():
     icon.save('icon.png')
     return icon
 
+def resize_and_save(icon, size, path):
+    """Save a square LANCZOS-resized copy of icon"""
+    icon.resize((size, size), Image.Resampling.LANCZOS).save(path)
+
 def create_icns(icon):
     """Create macOS .icns file"""
     if platform.system() != 'Darwin':
@@ -34,17 +39,19 @@ def create_icns(icon):
         iconset_dir = 'icon.iconset'
         os.makedirs(iconset_dir, exist_ok=True)
         
+        tasks = []
         for size in sizes:
             # Normal resolution
-            icon_size = size, size
-            resized = icon.resize(icon_size, Image.Resampling.LANCZOS)
-            resized.save(f'{iconset_dir}/icon_{size}x{size}.png')
+            tasks.append((size, f'{iconset_dir}/icon_{size}x{size}.png'))
             
             # High resolution (2x)
             if size <= 512:
-                icon_size = size * 2, size * 2
-                resized = icon.resize(icon_size, Image.Resampling.LANCZOS)
-                resized.save(f'{iconset_dir}/icon_{size}x{size}@2x.png')
+                tasks.append((size * 2, f'{iconset_dir}/icon_{size}x{size}@2x.png'))
+        
+        # Pillow releases the GIL while resizing, so threads run these in parallel
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for future in [executor.submit(resize_and_save, icon, size, path) for size, path in tasks]:
+                future.result()
         
         # Convert to icns using iconutil
         subprocess.run(['iconutil', '-c', 'icns', iconset_dir])
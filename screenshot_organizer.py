@@ -1,60 +1,285 @@
 import os
+import errno
 import datetime
 import base64
-from dotenv import load_dotenv
+import io
+import hashlib
 from PIL import Image
 import re
 import shutil
-import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import ReadTimeoutError
 import logging
 import traceback
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import platform
-
-# Set up logging
-log_dir = os.path.join(os.path.expanduser('~/Library/Application Support/ScreenshotOrganizer'), 'logs')
-os.makedirs(log_dir, exist_ok=True)
-log_file = os.path.join(log_dir, 'screenshot_organizer.log')
-
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler()  # This will print to terminal
-    ]
-)
+from config_manager import get_app_data_dir, get_config_path, load_json_cached, save_json, loads_json
+
+# Set up logging. The app routes records through a QueueListener before this
+# module is imported, so only configure handlers here when run standalone
+# (creating a FileHandler opens the log file even if basicConfig discards it).
+if not logging.getLogger().handlers:
+    log_dir = os.path.join(get_app_data_dir(), 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(os.path.join(log_dir, 'screenshot_organizer.log')),
+            logging.StreamHandler()  # This will print to terminal
+        ]
+    )
 
 logger = logging.getLogger(__name__)
 
-def get_config_path(filename):
-    """Get the platform-specific path for config files"""
-    if platform.system() == "Windows":
-        config_dir = os.path.join(os.getenv('APPDATA'), 'ScreenshotOrganizer')
-    elif platform.system() == "Darwin":  # macOS
-        config_dir = os.path.join(os.path.expanduser('~/Library/Application Support/ScreenshotOrganizer'))
-    else:  # Linux
-        config_dir = os.path.expanduser('~/.screenshotorganizer')
-    
-    # Create config directory if it doesn't exist
-    os.makedirs(config_dir, exist_ok=True)
-    
-    # Return full path to the config file
-    return os.path.join(config_dir, filename)
+# Serializes the settings.json stats update when folders are processed concurrently
+_settings_lock = threading.Lock()
+
+# Seconds between stats writes while a sweep is running; the rest go out at its end
+STATS_SAVE_INTERVAL = 5.0
+
+# Files that get classified, compared against the lowercased suffix
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg'})
+
+# Vision models work at a fixed low resolution, so full-size PNGs only cost upload time
+MAX_IMAGE_SIDE = 1280
+JPEG_QUALITY = 80
+
+# Compiled once; _parse_response runs concurrently on the describe pool.
+# \b keeps 'Category:' from matching inside 'Subcategory:' now that case is ignored
+_CATEGORY_RE = re.compile(r'\bCategory:\s*(\w+)', re.IGNORECASE)
+# Both fields in the requested order, in one scan; the two above cover other orders
+_RESPONSE_RE = re.compile(r'\bCategory:\s*(\w+).*?Subcategory:\s*(\w+)', re.IGNORECASE | re.DOTALL)
+_SUBCATEGORY_RE = re.compile(r'Subcategory:\s*(\w+)', re.IGNORECASE)
+# Same, but only once the subcategory word is followed by something, so a
+# streamed answer isn't cut off halfway through it
+_FINISHED_RESPONSE_RE = re.compile(r'\bCategory:\s*(\w+).*?Subcategory:\s*(\w+)\W',
+                                   re.IGNORECASE | re.DOTALL)
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\-_\. ]')
+# The same rule for ASCII names as a bytes translate table, which runs several
+# times faster; \w also keeps non-ASCII letters, so other names use the regex
+_UNSAFE_ASCII_TABLE = bytes(
+    c if chr(c).isascii() and (chr(c).isalnum() or chr(c) in '_-. ') else ord('_')
+    for c in range(256)
+)
+
+def _workers_from_env(default=8):
+    """SO_WORKERS from the environment, or default if it is unset or not a number"""
+    try:
+        return max(1, int(os.getenv('SO_WORKERS', default)))
+    except ValueError:
+        logger.warning(f"Ignoring invalid SO_WORKERS value, using {default}")
+        return default
+
+# Concurrent description requests; each one is mostly waiting on the AI provider
+DESCRIBE_WORKERS = _workers_from_env()
+_describe_pool = None
+_describe_pool_lock = threading.Lock()
+
+def get_describe_pool():
+    """Shared executor for description requests, so concurrent folders share the cap"""
+    global _describe_pool
+    with _describe_pool_lock:
+        if _describe_pool is None:
+            _describe_pool = ThreadPoolExecutor(max_workers=DESCRIBE_WORKERS,
+                                                thread_name_prefix='describe')
+        return _describe_pool
+
+def shutdown_describe_pool(timeout):
+    """Drop queued descriptions and wait up to timeout seconds for running ones
+
+    Returns True if every describe thread finished in time.
+    """
+    with _describe_pool_lock:
+        pool = _describe_pool
+    if pool is None:
+        return True
+    pool.shutdown(wait=False, cancel_futures=True)
+    deadline = time.monotonic() + timeout
+    for thread in threading.enumerate():
+        if thread.name.startswith('describe'):
+            thread.join(max(0, deadline - time.monotonic()))
+    return not any(thread.name.startswith('describe') and thread.is_alive()
+                   for thread in threading.enumerate())
+
+# Provider responses currently being streamed, so a shutdown can drop them
+# instead of waiting out REQUEST_TIMEOUT on a stalled read
+_open_requests = set()
+_open_requests_lock = threading.Lock()
+
+def _abort_request(response):
+    raw = getattr(response, 'raw', None)
+    shutdown = getattr(raw, 'shutdown', None)
+    try:
+        # urllib3 2.x can interrupt a read blocked in another thread; closing
+        # alone only takes effect once that read returns
+        if shutdown is not None:
+            shutdown()
+        close = getattr(response, 'close', None)
+        if close is not None:
+            close()
+    except Exception as e:
+        logger.debug(f"Error aborting request: {e}")
+
+def _register_request(response, cancel=None):
+    with _open_requests_lock:
+        _open_requests.add(response)
+    # Covers a stop that landed between sending the request and registering it
+    if cancel is not None and cancel.is_set():
+        _abort_request(response)
+
+def _unregister_request(response):
+    with _open_requests_lock:
+        _open_requests.discard(response)
+
+def abort_open_requests():
+    """Abort every in-flight provider request so blocked reads return now"""
+    with _open_requests_lock:
+        responses = list(_open_requests)
+    for response in responses:
+        _abort_request(response)
+
+# (connect, read) seconds for provider calls; vision models can take a while to answer
+REQUEST_TIMEOUT = (5, 120)
+
+# "content hash|provider|model" -> [category, subcategory] for images already
+# classified, so re-runs and duplicate screenshots skip the API call. Only exact
+# content matches are reused: screenshots of the same window layout look alike
+# at thumbnail scale even when their contents need different categories.
+CLASSIFICATION_CACHE_FILE = 'classification_cache.json'
+# Entries kept, least recently used dropped first (dict order is recency order)
+CLASSIFICATION_CACHE_MAX = 10000
+_classification_cache = None
+_classification_cache_dirty = False
+_classification_cache_lock = threading.Lock()
+
+def hash_image_data(data):
+    """Return the BLAKE2b-128 hex digest of an image file's bytes"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _get_classification_cache():
+    """Load the classification cache on first use; call with the lock held"""
+    global _classification_cache
+    if _classification_cache is None:
+        try:
+            # Copied because entries are added to it
+            _classification_cache = dict(load_json_cached(get_config_path(CLASSIFICATION_CACHE_FILE)))
+        except (FileNotFoundError, ValueError):
+            _classification_cache = {}
+    return _classification_cache
+
+def lookup_classification(key):
+    """Return the cached result for a content hash, or None"""
+    with _classification_cache_lock:
+        cache = _get_classification_cache()
+        entry = cache.pop(key, None)
+        if entry is None:
+            return None
+        # Re-insert as most recently used; saved with the next new entry rather
+        # than rewriting the file for a run that only hit the cache
+        cache[key] = entry
+    return {"category": entry[0], "subcategory": entry[1]}
+
+def store_classification(key, result):
+    """Remember a result; it is written out by flush_classification_cache"""
+    global _classification_cache_dirty
+    with _classification_cache_lock:
+        cache = _get_classification_cache()
+        cache.pop(key, None)
+        cache[key] = [result["category"], result["subcategory"]]
+        while len(cache) > CLASSIFICATION_CACHE_MAX:
+            del cache[next(iter(cache))]
+        _classification_cache_dirty = True
+
+def flush_classification_cache():
+    """Write the classification cache to disk if anything was added"""
+    global _classification_cache_dirty
+    with _classification_cache_lock:
+        if not _classification_cache_dirty:
+            return
+        try:
+            save_json(get_config_path(CLASSIFICATION_CACHE_FILE), _classification_cache, indent=None)
+            _classification_cache_dirty = False
+        except OSError as e:
+            logger.error(f"Error saving classification cache: {str(e)}")
+
+def collect_until_parsed(pieces, cancel=None):
+    """Join streamed text pieces, stopping as soon as both fields are complete
+
+    Reading also stops early if the optional cancel event is set.
+    """
+    content = ''
+    for piece in pieces:
+        if cancel is not None and cancel.is_set():
+            break
+        if piece:
+            content += piece
+            if _FINISHED_RESPONSE_RE.search(content):
+                break
+    return content
+
+def make_session():
+    """Create a requests.Session pooled for DESCRIBE_WORKERS concurrent calls"""
+    session = requests.Session()
+    # Retry failed connects and brief gateway errors; the request only asks for
+    # a description, so repeating the POST is safe. Read timeouts are not
+    # retried: the model is busy generating, and resending would queue the same
+    # slow generation again
+    retries = Retry(total=2, connect=2, read=0, status=2, backoff_factor=0.2,
+                    status_forcelist=[502, 503, 504], allowed_methods=frozenset({'POST'}))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=DESCRIBE_WORKERS, max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# JPEG APPn segments that carry no personal metadata (JFIF, Adobe colour info)
+_PLAIN_JPEG_SEGMENTS = frozenset({'APP0', 'APP14'})
+
+def encode_image_for_upload(data):
+    """Downscale an image file's bytes to MAX_IMAGE_SIDE and return them as base64 JPEG"""
+    with Image.open(io.BytesIO(data)) as img:
+        # Opening only parses the header; a JPEG that is already small enough is
+        # sent as-is rather than decoded and re-encoded. Only when it carries no
+        # metadata beyond JFIF/Adobe headers, since EXIF, XMP and IPTC can hold
+        # GPS positions and device serials; re-encoding drops them
+        if (img.format == 'JPEG' and img.mode == 'RGB' and max(img.size) <= MAX_IMAGE_SIDE
+                and all(marker in _PLAIN_JPEG_SEGMENTS for marker, _ in img.applist)):
+            return base64.b64encode(data).decode('ascii')
+        # JPEG has no alpha channel or palette
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        # Box-reduce by the whole factor first so LANCZOS only covers the
+        # remainder; the default gap of 2 skips that step for 2-4x downscales
+        img.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE), Image.Resampling.LANCZOS,
+                      reducing_gap=1.0)
+        buffer = io.BytesIO()
+        img.save(buffer, format='JPEG', quality=JPEG_QUALITY)
+    # getbuffer() is a view of the encoded bytes, getvalue() would copy them
+    with buffer.getbuffer() as view:
+        return base64.b64encode(view).decode('ascii')
 
 class ImageProcessor:
-    def __init__(self):
+    def __init__(self, session=None, cancel=None):
+        # Reusing one session (and one Together client) keeps connections alive
+        # between images instead of paying a new TCP+TLS handshake for each
+        self.session = session or make_session()
+        self._together_client = None
+        # Checked while a reply streams in, so a stop doesn't wait for the whole answer
+        self.cancel = cancel
         self.load_settings()
         
     def load_settings(self):
         settings_path = get_config_path('settings.json')
         logger.info(f"Loading settings from: {settings_path}")
-        if os.path.exists(settings_path):
-            with open(settings_path, 'r') as f:
-                self.settings = json.load(f)
-                logger.info(f"Loaded settings: {self.settings}")
-        else:
+        try:
+            # Shared with the GUI's cache; only read from, never mutated here
+            self.settings = load_json_cached(settings_path)
+            logger.info(f"Loaded settings: {self.settings}")
+        except FileNotFoundError:
             self.settings = {
                 'provider': 'Together AI',
                 'model': 'Llama-3.2-11B-Vision-Instruct-Turbo',
@@ -64,6 +289,14 @@ class ImageProcessor:
                 'ollama_api_key': ''
             }
             logger.info("Using default settings")
+        
+        # Without a configured key, fall back to TOGETHER_API_KEY from the
+        # environment or a .env file
+        self.together_api_key = self.settings.get('together_api_key')
+        if not self.together_api_key:
+            from dotenv import load_dotenv
+            load_dotenv()
+            self.together_api_key = os.getenv('TOGETHER_API_KEY', '')
 
     def get_image_description(self, image_path):
         logger.info(f"Processing image: {image_path}")
@@ -80,18 +313,31 @@ class ImageProcessor:
         Analyze the given image and provide the category and subcategory in the specified format."""
         
         try:
-            with open(image_path, "rb") as image_file:
-                image_data = image_file.read()
-                base64_image = base64.b64encode(image_data).decode('utf-8')
+            # Identical screenshots (or a re-run over the same files) reuse the earlier
+            # answer, as long as it came from the same provider and model
+            scope = f"{self.settings['provider']}|{self.settings['model']}"
+            # Read once; hashing and encoding both work from these bytes
+            with open(image_path, 'rb') as f:
+                data = f.read()
+            cache_key = f"{hash_image_data(data)}|{scope}"
+            cached = lookup_classification(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached classification: {cached}")
+                return cached
             
             if self.settings['provider'] == 'Together AI':
-                if not self.settings.get('together_api_key'):
+                if not self.together_api_key:
                     raise Exception("Together AI API key is not set. Please configure it in settings.")
                 logger.info("Using Together AI provider")
-                return self._together_ai_process(prompt, base64_image)
+                result = self._together_ai_process(prompt, encode_image_for_upload(data))
             else:
                 logger.info("Using Ollama provider")
-                return self._ollama_process(prompt, base64_image, image_path)
+                result = self._ollama_process(prompt, encode_image_for_upload(data), image_path)
+            
+            # Unparseable answers come back as 'unknown'; let those be retried next time
+            if result["category"] != "unknown":
+                store_classification(cache_key, result)
+            return result
         except Exception as e:
             logger.error(f"Error in get_image_description: {str(e)}")
             logger.error(traceback.format_exc())
@@ -99,11 +345,13 @@ class ImageProcessor:
 
     def _together_ai_process(self, prompt, base64_image):
         try:
-            # Only import Together when needed
-            from together import Together
-            client = Together(api_key=self.settings['together_api_key'])
+            if self._together_client is None:
+                # Only import Together when needed
+                from together import Together
+                self._together_client = Together(api_key=self.together_api_key)
             logger.info("Making Together AI API call")
-            response = client.chat.completions.create(
+            # Streamed so the connection can be dropped once the answer is parseable
+            stream = self._together_client.chat.completions.create(
                 model=self.settings['model'],
                 messages=[
                     {
@@ -119,10 +367,20 @@ class ImageProcessor:
                         ],
                     }
                 ],
-                stream=False
+                stream=True
             )
+            _register_request(stream, self.cancel)
+            try:
+                content = collect_until_parsed(
+                    (chunk.choices[0].delta.content for chunk in stream if chunk.choices),
+                    self.cancel)
+            finally:
+                _unregister_request(stream)
+                close = getattr(stream, 'close', None)
+                if close is not None:
+                    close()
             
-            content = response.choices[0].message.content.strip()
+            content = content.strip()
             logger.info(f"Together AI response: {content}")
             return self._parse_response(content, "Together AI response")
         except Exception as e:
@@ -139,45 +397,54 @@ class ImageProcessor:
             headers['Authorization'] = f"Bearer {self.settings['ollama_api_key']}"
         
         try:
-            # Convert image to base64
-            with Image.open(image_path) as img:
-                # Ensure the image is in RGB mode
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Resize if too large (Ollama has size limits)
-                max_size = 1024
-                if max(img.size) > max_size:
-                    ratio = max_size / max(img.size)
-                    new_size = tuple(int(dim * ratio) for dim in img.size)
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
-            
+            # base64_image is already downscaled and JPEG-encoded
             data = {
                 "model": self.settings['model'],
                 "prompt": prompt,
-                "stream": False,
+                # Streamed so the connection (and generation) stops once the
+                # answer is parseable instead of waiting for the whole reply
+                "stream": True,
                 "images": [base64_image]
             }
             
-            logger.info(f"Ollama request data: {data}")
-            response = requests.post(url, json=data, headers=headers)
-            
-            if response.status_code != 200:
-                error_msg = f"Ollama API error: Status {response.status_code}"
-                try:
-                    error_details = response.json()
-                    error_msg += f", Details: {error_details}"
-                except:
-                    error_msg += f", Response: {response.text}"
-                logger.error(error_msg)
-                raise Exception(error_msg)
-            
-            content = response.json().get('response', '')
+            if logger.isEnabledFor(logging.DEBUG):
+                # Never log the image itself; it is hundreds of KB of base64
+                logger.debug("Ollama request data: %s",
+                             {**data, "images": [f"<{len(base64_image)} base64 chars>"]})
+            response = self.session.post(url, json=data, headers=headers, timeout=REQUEST_TIMEOUT,
+                                         stream=True)
+            _register_request(response, self.cancel)
+            try:
+                with response:
+                    if response.status_code != 200:
+                        error_msg = f"Ollama API error: Status {response.status_code}"
+                        try:
+                            error_details = response.json()
+                            error_msg += f", Details: {error_details}"
+                        except:
+                            error_msg += f", Response: {response.text}"
+                        logger.error(error_msg)
+                        raise Exception(error_msg)
+                    
+                    # One JSON object per line, each carrying the next piece of the reply
+                    content = collect_until_parsed(
+                        (loads_json(line).get('response', '') for line in response.iter_lines() if line),
+                        self.cancel)
+            finally:
+                _unregister_request(response)
             logger.info(f"Ollama response: {content}")
             return self._parse_response(content, "Ollama response")
             
-        except requests.exceptions.ConnectionError:
-            error_msg = "Could not connect to Ollama. Please ensure Ollama is running and try again."
+        except (requests.exceptions.ReadTimeout, requests.exceptions.ConnectionError) as e:
+            # With read retries off, a read timeout surfaces as a ConnectionError
+            # wrapping the urllib3 error (or its MaxRetryError) instead
+            cause = e.args[0] if e.args else None
+            if isinstance(e, requests.exceptions.ReadTimeout) or \
+                    isinstance(getattr(cause, 'reason', cause), ReadTimeoutError):
+                error_msg = (f"Ollama did not answer within {REQUEST_TIMEOUT[1]} seconds. "
+                             f"Try a smaller model or fewer concurrent requests (SO_WORKERS).")
+            else:
+                error_msg = "Could not connect to Ollama. Please ensure Ollama is running and try again."
             logger.error(error_msg)
             raise Exception(error_msg)
             
@@ -208,16 +475,21 @@ class ImageProcessor:
     def _parse_response(self, content, source):
         try:
             logger.info(f"Parsing response from {source}: {content}")
-            category_match = re.search(r'Category:\s*(\w+)', content)
-            subcategory_match = re.search(r'Subcategory:\s*(\w+)', content)
-            
-            if not category_match or not subcategory_match:
-                logger.warning(f"Could not parse category/subcategory from response: {content}")
-                return {"category": "unknown", "subcategory": "unclassified"}
+            match = _RESPONSE_RE.search(content)
+            if match:
+                category, subcategory = match.group(1, 2)
+            else:
+                category_match = _CATEGORY_RE.search(content)
+                subcategory_match = _SUBCATEGORY_RE.search(content)
+                
+                if not category_match or not subcategory_match:
+                    logger.warning(f"Could not parse category/subcategory from response: {content}")
+                    return {"category": "unknown", "subcategory": "unclassified"}
+                category, subcategory = category_match.group(1), subcategory_match.group(1)
             
             result = {
-                "category": category_match.group(1).lower(),
-                "subcategory": subcategory_match.group(1).lower()
+                "category": category.lower(),
+                "subcategory": subcategory.lower()
             }
             logger.info(f"Parsed result: {result}")
             return result
@@ -227,24 +499,70 @@ class ImageProcessor:
             logger.error(traceback.format_exc())
             return {"category": "unknown", "subcategory": "error"}
 
-def get_creation_date(file_path):
-    return datetime.datetime.fromtimestamp(os.path.getctime(file_path))
+def get_creation_stamp(entry):
+    """Creation time of an os.DirEntry as YYYYmmdd_HHMMSS, from the stat it caches"""
+    return time.strftime('%Y%m%d_%H%M%S', time.localtime(entry.stat().st_ctime))
 
 def sanitize_filename(filename):
-    return re.sub(r'[^\w\-_\. ]', '_', filename)
+    if filename.isascii():
+        return filename.encode('ascii').translate(_UNSAFE_ASCII_TABLE).decode('ascii')
+    return _UNSAFE_FILENAME_RE.sub('_', filename)
+
+def save_stats(settings_path, processed, categories, last_processed_date):
+    """Add a batch of results to the stats in settings.json with a single write"""
+    with _settings_lock:
+        try:
+            # Copy the cached dict (and its stats) before modifying it
+            settings = dict(load_json_cached(settings_path))
+        except FileNotFoundError:
+            return
+        
+        saved = dict(settings.get('stats', {}))
+        saved['total_images_processed'] = saved.get('total_images_processed', 0) + processed
+        saved['last_processed_date'] = last_processed_date
+        saved['categories_created'] = sorted(categories.union(saved.get('categories_created', [])))
+        settings['stats'] = saved
+        save_json(settings_path, settings)
+
+def process_screenshots(folder_path, callback=None, cancel=None, session=None):
+    """Process screenshots in the given folder with progress callback
 
-def process_screenshots(folder_path, callback=None):
-    """Process screenshots in the given folder with progress callback"""
-    processor = ImageProcessor()
+    cancel is an optional threading.Event; setting it stops before the next file.
+    session is an optional requests.Session shared across calls to reuse connections.
+    """
+    processor = ImageProcessor(session, cancel)
     stats = {
         'total_images_processed': 0,
         'categories_created': set(),
         'last_processed_date': None
     }
     
+    futures = []
+    settings_path = get_config_path('settings.json')
+    # Processed files not yet counted in settings.json
+    unsaved = 0
+    last_saved = time.monotonic()
+    # last_processed_date only has second-level meaning; refresh it at most once a second
+    last_stamped = None
+    # Category folders already created this run, so makedirs runs once per category
+    ensured_dirs = set()
     try:
-        for filename in os.listdir(folder_path):
+        # Request every description up front so the round-trips overlap; files
+        # are still moved one at a time, in order, on this thread
+        pool = get_describe_pool()
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                name = entry.name
+                # Slicing at the last dot only lowercases the extension, and is
+                # cheaper than splitext for folders full of non-image files
+                if name[name.rfind('.'):].lower() in IMAGE_EXTENSIONS and entry.is_file():
+                    futures.append((entry, pool.submit(processor.get_image_description, entry.path)))
+        
+        for entry, future in futures:
             # Check if processing should stop
+            if cancel is not None and cancel.is_set():
+                logger.info("Processing stopped by user")
+                break
             if callback:
                 should_continue = callback({
                     'status': 'checking',
@@ -254,78 +572,74 @@ def process_screenshots(folder_path, callback=None):
                     logger.info("Processing stopped by user")
                     break
                 
-            if filename.lower().endswith(('.png', '.jpg', '.jpeg')):
-                file_path = os.path.join(folder_path, filename)
-                try:
-                    # Get image category
-                    result = processor.get_image_description(file_path)
-                    category = result["category"]
-                    subcategory = result["subcategory"]
-                    
-                    # Create category folder
-                    category_folder = os.path.join(folder_path, f"{category}_{subcategory}")
+            filename = entry.name
+            file_path = entry.path
+            try:
+                # Get image category
+                result = future.result()
+                category = result["category"]
+                subcategory = result["subcategory"]
+                
+                # Create category folder
+                category_folder = os.path.join(folder_path, f"{category}_{subcategory}")
+                if category_folder not in ensured_dirs:
                     os.makedirs(category_folder, exist_ok=True)
-                    
-                    # Generate unique filename
-                    creation_date = get_creation_date(file_path)
-                    base_name = os.path.splitext(filename)[0]
-                    extension = os.path.splitext(filename)[1]
-                    new_filename = sanitize_filename(f"{base_name}_{creation_date.strftime('%Y%m%d_%H%M%S')}{extension}")
-                    
-                    # Define new file path in the category subfolder
-                    new_file_path = os.path.join(category_folder, new_filename)
-                    
-                    # Move the file
+                    ensured_dirs.add(category_folder)
+                
+                # Generate unique filename
+                base_name, extension = os.path.splitext(filename)
+                new_filename = sanitize_filename(f"{base_name}_{get_creation_stamp(entry)}{extension}")
+                
+                # Define new file path in the category subfolder
+                new_file_path = os.path.join(category_folder, new_filename)
+                
+                # Move the file; the category folder sits inside the source folder,
+                # so a plain rename works unless it is a mount point of its own
+                try:
+                    os.replace(file_path, new_file_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
                     shutil.move(file_path, new_file_path)
-                    logger.info(f"Moved {filename} to {new_file_path}")
-                    
-                    # Update statistics
-                    stats['total_images_processed'] += 1
-                    stats['categories_created'].add(f"{category}_{subcategory}")
+                logger.info(f"Moved {filename} to {new_file_path}")
+                
+                # Update statistics
+                stats['total_images_processed'] += 1
+                stats['categories_created'].add(f"{category}_{subcategory}")
+                now = time.monotonic()
+                if last_stamped is None or now - last_stamped >= 1.0:
                     stats['last_processed_date'] = datetime.datetime.now().isoformat()
+                    last_stamped = now
+                
+                # Update settings file with new statistics, a batch at a time
+                unsaved += 1
+                if now - last_saved >= STATS_SAVE_INTERVAL:
+                    save_stats(settings_path, unsaved, stats['categories_created'],
+                               stats['last_processed_date'])
+                    unsaved = 0
+                    last_saved = time.monotonic()
+                
+                # Call progress callback if provided
+                if callback:
+                    callback({
+                        'status': 'processing',
+                        'file': filename,
+                        'category': category,
+                        'subcategory': subcategory,
+                        'stats': stats
+                    })
                     
-                    # Update settings file with new statistics
-                    settings_path = get_config_path('settings.json')
-                    if os.path.exists(settings_path):
-                        with open(settings_path, 'r') as f:
-                            settings = json.load(f)
-                        
-                        # Update stats in settings
-                        if 'stats' not in settings:
-                            settings['stats'] = {}
-                        settings['stats']['total_images_processed'] = (
-                            settings['stats'].get('total_images_processed', 0) + 1
-                        )
-                        settings['stats']['last_processed_date'] = stats['last_processed_date']
-                        settings['stats']['categories_created'] = list(set(
-                            settings['stats'].get('categories_created', []) + 
-                            [f"{category}_{subcategory}"]
-                        ))
-                        
-                        with open(settings_path, 'w') as f:
-                            json.dump(settings, f, indent=4)
-                    
-                    # Call progress callback if provided
-                    if callback:
-                        callback({
-                            'status': 'processing',
-                            'file': filename,
-                            'category': category,
-                            'subcategory': subcategory,
-                            'stats': stats
-                        })
-                        
-                except Exception as e:
-                    logger.error(f"Error processing {filename}: {str(e)}")
-                    logger.error(traceback.format_exc())
-                    if callback:
-                        callback({
-                            'status': 'error',
-                            'error': f"Error processing {filename}: {str(e)}",
-                            'stats': stats
-                        })
-                    continue
-    
+            except Exception as e:
+                logger.error(f"Error processing {filename}: {str(e)}")
+                logger.error(traceback.format_exc())
+                if callback:
+                    callback({
+                        'status': 'error',
+                        'error': f"Error processing {filename}: {str(e)}",
+                        'stats': stats
+                    })
+                continue
+
     except Exception as e:
         logger.error(f"Error processing folder {folder_path}: {str(e)}")
         logger.error(traceback.format_exc())
@@ -335,6 +649,17 @@ def process_screenshots(folder_path, callback=None):
                 'error': f"Error processing folder: {str(e)}",
                 'stats': stats
             })
+    finally:
+        # Don't leave requests queued for files that won't be moved
+        for _, future in futures:
+            future.cancel()
+        flush_classification_cache()
+        if unsaved:
+            try:
+                save_stats(settings_path, unsaved, stats['categories_created'],
+                           stats['last_processed_date'])
+            except OSError as e:
+                logger.error(f"Error saving stats: {str(e)}")
     
     # Final callback with complete status
     if callback:
@@ -11,7 +11,6 @@ hidden_imports = [
     'PIL',
     'together',
     'requests',
-    'pystray',
     'webbrowser',
     'platform',
     'json',
@@ -1,41 +1,182 @@
-import os
-import json
+import time
+import threading
+from functools import lru_cache
 from datetime import datetime
-import webbrowser
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPushButton, 
-                            QMessageBox, QWidget, QHBoxLayout)
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QDesktopServices
+                            QWidget, QHBoxLayout, QFrame)
+from PyQt6.QtCore import Qt, QTimer, QCoreApplication
 import logging
+from config_manager import get_config_path, load_json_cached, save_json
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
-# Import platform-specific settings from app.py
-try:
-    from app import get_config_path, get_app_data_dir
-except ImportError:
-    # Fallback if app.py is not available
-    import platform
-    def get_app_data_dir():
-        if platform.system() == "Windows":
-            app_data = os.getenv('APPDATA')
-            base_dir = os.path.join(app_data, 'ScreenshotOrganizer')
-        elif platform.system() == "Darwin":  # macOS
-            base_dir = os.path.expanduser('~/Library/Application Support/ScreenshotOrganizer')
-        else:  # Linux/Unix
-            base_dir = os.path.expanduser('~/.screenshotorganizer')
-        os.makedirs(base_dir, exist_ok=True)
-        return base_dir
+# Seconds between promotional messages
+PROMO_INTERVAL = 7 * 24 * 60 * 60
+# Newest promo_history entries kept in user_data.json
+PROMO_HISTORY_MAX = 100
+# Milliseconds to wait before writing user_data.json, so bursts share one write
+SAVE_DELAY_MS = 500
 
-    def get_config_path(filename):
-        return os.path.join(get_app_data_dir(), filename)
+REGISTRATION_INSTRUCTIONS = (
+    "Welcome to Screenshot Organizer!\n\n"
+    "To get started, please complete these steps:\n"
+    "1. Register using the form below\n"
+    "2. Subscribe to our YouTube channel for tips and tutorials\n"
+    "3. Click 'Done' to start using the application"
+)
+PROMO_TITLE_FMT = "kno2gether - {}"
+
+# Stylesheet for UserRegistrationDialog; widgets opt in via setObjectName().
+# Cards are QFrames styled by name like the dashboard cards, so their frame
+# rules don't cascade to the labels inside. Later rules win ties.
+REGISTRATION_QSS = """
+    QLabel#registrationTitle {
+        font-size: 24px;
+        font-weight: bold;
+        color: #1565C0;
+        margin-bottom: 10px;
+    }
+    QFrame#creatorCard {
+        background-color: #FFFFFF;
+        border: 1px solid #BBDEFB;
+        border-radius: 8px;
+        margin: 10px 0;
+    }
+    QLabel#channelIcon {
+        color: #1565C0;
+        font-size: 24px;
+    }
+    QLabel#channelName {
+        color: #1565C0;
+        font-size: 18px;
+        font-weight: bold;
+    }
+    QLabel#channelDesc {
+        font-size: 12px;
+        color: #666;
+    }
+    QPushButton#creatorSubscribeButton {
+        background-color: #FF0000;
+        color: white;
+        padding: 6px 15px;
+        border: none;
+        border-radius: 4px;
+        font-size: 13px;
+        font-weight: bold;
+    }
+    QPushButton#creatorSubscribeButton:hover {
+        background-color: #CC0000;
+    }
+    QFrame#instructionsCard {
+        background-color: #E3F2FD;
+        border: 1px solid #90CAF9;
+        border-radius: 10px;
+        padding: 20px;
+    }
+    QLabel#instructionsText {
+        color: #424242;
+        font-size: 14px;
+    }
+    QWidget#dialogButtons, QPushButton#registerButton, QPushButton#doneButton,
+    QPushButton#cancelButton {
+        margin-top: 20px;
+    }
+    QPushButton#registerButton, QPushButton#doneButton, QPushButton#cancelButton {
+        padding: 10px 20px;
+        border: none;
+        border-radius: 4px;
+        font-size: 14px;
+        color: white;
+        min-width: 150px;
+    }
+    QPushButton#registerButton {
+        background-color: #4CAF50;
+    }
+    QPushButton#registerButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton#doneButton {
+        background-color: #2196F3;
+    }
+    QPushButton#doneButton:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#cancelButton {
+        background-color: #f44336;
+    }
+    QPushButton#cancelButton:hover {
+        background-color: #d32f2f;
+    }
+"""
+
+# Stylesheet for PromotionalDialog
+PROMO_QSS = """
+    QLabel#promoMessage {
+        font-size: 14px;
+        margin-bottom: 10px;
+    }
+    QLabel#promoDetails {
+        font-size: 12px;
+        color: #666;
+        margin-bottom: 20px;
+    }
+    QPushButton#openOfferButton, QPushButton#closeOfferButton {
+        color: white;
+        padding: 10px 20px;
+        border: none;
+        border-radius: 4px;
+        font-size: 14px;
+    }
+    QPushButton#openOfferButton {
+        background-color: #4CAF50;
+        min-width: 150px;
+    }
+    QPushButton#openOfferButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton#closeOfferButton {
+        background-color: #f44336;
+        min-width: 100px;
+    }
+    QPushButton#closeOfferButton:hover {
+        background-color: #da190b;
+    }
+"""
+
+# webbrowser's first-use browser registration isn't thread-safe
+_browser_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _browser():
+    """Find the default browser once; discovery can probe several executables"""
+    import webbrowser
+    return webbrowser.get()
+
+def _open_in_browser(url):
+    try:
+        with _browser_lock:
+            browser = _browser()
+        browser.open(url)
+    except Exception:
+        logger.exception(f"Could not open {url}")
+
+def open_url(url):
+    """Open url in the default browser without blocking the UI thread
+
+    Both browser discovery and launching it can spawn processes, so they run
+    on a short-lived background thread.
+    """
+    threading.Thread(target=_open_in_browser, args=(url,), daemon=True).start()
 
 class UserRegistrationDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Welcome to Screenshot Organizer by kno2gether")
         self.setModal(True)
+        # Shown at most once; free its widgets instead of keeping them as
+        # children of the main window. PromotionalDialog is reused instead.
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         self.initUI()
 
     def initUI(self):
@@ -43,39 +184,22 @@ class UserRegistrationDialog(QDialog):
         layout.setSpacing(20)
         layout.setContentsMargins(30, 30, 30, 30)
 
-        # Welcome title with styling
+        # Welcome title
         title = QLabel("Welcome to Screenshot Organizer")
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #1565C0;
-                margin-bottom: 10px;
-            }
-        """)
+        title.setObjectName("registrationTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         # Creator info container
-        creator_widget = QWidget()
-        creator_widget.setStyleSheet("""
-            QWidget {
-                background-color: #FFFFFF;
-                border: 1px solid #BBDEFB;
-                border-radius: 8px;
-                margin: 10px 0;
-            }
-            QLabel {
-                color: #1565C0;
-            }
-        """)
+        creator_widget = QFrame()
+        creator_widget.setObjectName("creatorCard")
         creator_layout = QHBoxLayout(creator_widget)
         creator_layout.setContentsMargins(15, 10, 15, 10)
         creator_layout.setSpacing(10)
 
         # Channel icon/logo
         channel_icon = QLabel("🎥")
-        channel_icon.setStyleSheet("font-size: 24px;")
+        channel_icon.setObjectName("channelIcon")
         creator_layout.addWidget(channel_icon)
 
         # Channel name and description
@@ -83,31 +207,18 @@ class UserRegistrationDialog(QDialog):
         channel_info.setSpacing(2)
         
         channel_name = QLabel("kno2gether")
-        channel_name.setStyleSheet("font-size: 18px; font-weight: bold;")
+        channel_name.setObjectName("channelName")
         channel_info.addWidget(channel_name)
         
         channel_desc = QLabel("AI & Tech Tutorials")
-        channel_desc.setStyleSheet("font-size: 12px; color: #666;")
+        channel_desc.setObjectName("channelDesc")
         channel_info.addWidget(channel_desc)
         
         creator_layout.addLayout(channel_info)
         
         # YouTube button
         youtube_btn = QPushButton("Subscribe")
-        youtube_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF0000;
-                color: white;
-                padding: 6px 15px;
-                border: none;
-                border-radius: 4px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #CC0000;
-            }
-        """)
+        youtube_btn.setObjectName("creatorSubscribeButton")
         youtube_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         youtube_btn.clicked.connect(self.open_youtube)
         creator_layout.addWidget(youtube_btn)
@@ -115,92 +226,35 @@ class UserRegistrationDialog(QDialog):
         layout.addWidget(creator_widget)
 
         # Instructions container
-        instructions_widget = QWidget()
-        instructions_widget.setStyleSheet("""
-            QWidget {
-                background-color: #E3F2FD;
-                border: 1px solid #90CAF9;
-                border-radius: 10px;
-                padding: 20px;
-            }
-            QLabel {
-                color: #424242;
-                font-size: 14px;
-                line-height: 1.4;
-            }
-        """)
+        instructions_widget = QFrame()
+        instructions_widget.setObjectName("instructionsCard")
         instructions_layout = QVBoxLayout(instructions_widget)
         
-        instructions = QLabel(
-            "Welcome to Screenshot Organizer!\n\n"
-            "To get started, please complete these steps:\n"
-            "1. Register using the form below\n"
-            "2. Subscribe to our YouTube channel for tips and tutorials\n"
-            "3. Click 'Done' to start using the application"
-        )
+        instructions = QLabel(REGISTRATION_INSTRUCTIONS)
+        instructions.setObjectName("instructionsText")
         instructions.setWordWrap(True)
         instructions_layout.addWidget(instructions)
         layout.addWidget(instructions_widget)
 
-        # Buttons container with styling
+        # Buttons container
         button_container = QWidget()
-        button_container.setStyleSheet("""
-            QWidget {
-                margin-top: 20px;
-            }
-        """)
+        button_container.setObjectName("dialogButtons")
         button_layout = QHBoxLayout()
         button_container.setLayout(button_layout)
 
-        # Common button style
-        button_style = """
-            QPushButton {
-                padding: 10px 20px;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                color: white;
-                min-width: 150px;
-            }
-            QPushButton:hover {
-                opacity: 0.9;
-            }
-        """
-
         # Register button
         register_btn = QPushButton("📝 Register Now")
-        register_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background-color: #4CAF50;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        register_btn.setObjectName("registerButton")
         register_btn.clicked.connect(self.open_registration_form)
 
         # Done button
         done_btn = QPushButton("✅ Done")
-        done_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background-color: #2196F3;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
+        done_btn.setObjectName("doneButton")
         done_btn.clicked.connect(self.accept)
 
         # Cancel button
         cancel_btn = QPushButton("❌ Cancel")
-        cancel_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background-color: #f44336;
-            }
-            QPushButton:hover {
-                background-color: #d32f2f;
-            }
-        """)
+        cancel_btn.setObjectName("cancelButton")
         cancel_btn.clicked.connect(self.reject)
 
         # Add buttons to layout
@@ -210,39 +264,40 @@ class UserRegistrationDialog(QDialog):
 
         layout.addWidget(button_container)
         self.setLayout(layout)
+        # One sheet for the whole dialog, parsed once instead of per widget
+        self.setStyleSheet(REGISTRATION_QSS)
 
         # Set a minimum size for the dialog
         self.setMinimumWidth(700)
         self.setMinimumHeight(400)
 
     def open_registration_form(self):
-        webbrowser.open('https://knolabs.biz/community')
+        open_url('https://knolabs.biz/community')
 
     def open_youtube(self):
-        webbrowser.open('https://www.youtube.com/@kno2gether')
+        open_url('https://www.youtube.com/@kno2gether')
 
 class PromotionalDialog(QDialog):
+    """Promotion dialog that can be kept around and re-filled with setPromo()"""
     def __init__(self, parent=None, promo_data=None):
         super().__init__(parent)
-        self.promo_data = promo_data
-        self.setWindowTitle(promo_data["title"])
+        self.promo_data = None
         self.setModal(True)
         self.setMinimumSize(800, 600)
         
         layout = QVBoxLayout()
         
         # Message label
-        message_label = QLabel(promo_data["message"])
-        message_label.setWordWrap(True)
-        message_label.setStyleSheet("font-size: 14px; margin-bottom: 10px;")
-        layout.addWidget(message_label)
+        self.message_label = QLabel()
+        self.message_label.setWordWrap(True)
+        self.message_label.setObjectName("promoMessage")
+        layout.addWidget(self.message_label)
         
-        # Details label
-        if "details" in promo_data:
-            details_label = QLabel(promo_data["details"])
-            details_label.setWordWrap(True)
-            details_label.setStyleSheet("font-size: 12px; color: #666; margin-bottom: 20px;")
-            layout.addWidget(details_label)
+        # Details label, hidden for promotions without details
+        self.details_label = QLabel()
+        self.details_label.setWordWrap(True)
+        self.details_label.setObjectName("promoDetails")
+        layout.addWidget(self.details_label)
         
         # Button container
         button_container = QWidget()
@@ -251,59 +306,54 @@ class PromotionalDialog(QDialog):
         
         # Open Offer button
         open_offer_btn = QPushButton("Open Offer")
+        open_offer_btn.setObjectName("openOfferButton")
         open_offer_btn.clicked.connect(self.open_offer)
-        open_offer_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                min-width: 150px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
         
         # Close button
         close_btn = QPushButton("Close")
+        close_btn.setObjectName("closeOfferButton")
         close_btn.clicked.connect(self.accept)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-        """)
         
         button_layout.addWidget(open_offer_btn)
         button_layout.addWidget(close_btn)
         
         layout.addWidget(button_container)
         self.setLayout(layout)
+        self.setStyleSheet(PROMO_QSS)
+        
+        if promo_data is not None:
+            self.setPromo(promo_data)
+    
+    def setPromo(self, promo_data):
+        """Show promo_data; only the texts change, the widgets are reused"""
+        self.promo_data = promo_data
+        self.setWindowTitle(PROMO_TITLE_FMT.format(promo_data["title"]))
+        self.message_label.setText(promo_data["message"])
+        self.details_label.setText(promo_data.get("details", ""))
+        self.details_label.setVisible("details" in promo_data)
     
     def open_offer(self):
-        webbrowser.open(self.promo_data["form_url"])
+        """Open the promotion's form in the browser and close the dialog"""
+        target_url = self.promo_data.get("form_url", "")
+        if target_url:
+            logger.info(f"Opening promotion URL: {target_url}")
+            open_url(target_url)
+        self.accept()
 
 class UserManager:
     def __init__(self):
         self.user_data_file = get_config_path('user_data.json')
+        # Created on the first deferred save, once a Qt event loop exists
+        self._save_timer = None
         self.load_user_data()
         
     def load_user_data(self):
-        if os.path.exists(self.user_data_file):
-            with open(self.user_data_file, 'r') as f:
-                self.user_data = json.load(f)
-        else:
+        try:
+            # Shared with config_manager's mtime cache, so copy the parts that
+            # get modified; promo_history is appended to in place
+            cached = load_json_cached(self.user_data_file)
+            self.user_data = dict(cached, promo_history=list(cached.get("promo_history", ())))
+        except FileNotFoundError:
             self.user_data = {
                 "registered": False,
                 "registration_date": None,
@@ -311,12 +361,35 @@ class UserManager:
                 "promo_history": []
             }
             self.save_user_data()
+        # Parsed once here so should_show_promo is a plain comparison
+        last_shown = self.user_data.get("last_promo_shown")
+        self._last_promo_epoch = datetime.fromisoformat(last_shown).timestamp() if last_shown else None
     
     def save_user_data(self):
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(self.user_data_file), exist_ok=True)
-        with open(self.user_data_file, 'w') as f:
-            json.dump(self.user_data, f)
+        """Schedule a write of user_data.json; changes within SAVE_DELAY_MS share it"""
+        app = QCoreApplication.instance()
+        if app is None:
+            # No event loop to run the timer, so write straight away
+            self.flush_user_data()
+            return
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(SAVE_DELAY_MS)
+            self._save_timer.timeout.connect(self.flush_user_data)
+            app.aboutToQuit.connect(self.flush_user_data)
+        self._save_timer.start()
+    
+    def flush_user_data(self):
+        """Write user_data.json now, cancelling any scheduled write
+
+        save_json skips the write if nothing changed since the last one.
+        """
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        # One bytes write to a temp file, swapped in atomically; the config
+        # directory is created when config_manager is imported
+        save_json(self.user_data_file, self.user_data, indent=None)
     
     def is_registered(self):
         return self.user_data.get("registered", False)
@@ -324,92 +397,26 @@ class UserManager:
     def mark_registered(self):
         self.user_data["registered"] = True
         self.user_data["registration_date"] = datetime.now().isoformat()
-        self.save_user_data()
+        # Written immediately; losing it would ask the user to register again
+        self.flush_user_data()
     
     def should_show_promo(self):
         """Check if it's time to show a promotional message"""
-        last_shown = self.user_data.get("last_promo_shown")
-        if not last_shown:
+        if self._last_promo_epoch is None:
             return True
-            
-        last_shown_date = datetime.fromisoformat(last_shown)
-        days_since_last = (datetime.now() - last_shown_date).days
         
         # Show promos every 7 days
-        return days_since_last >= 7
+        return time.time() - self._last_promo_epoch >= PROMO_INTERVAL
     
     def record_promo_shown(self, promo_id):
         """Record that a promotional message was shown"""
-        self.user_data["last_promo_shown"] = datetime.now().isoformat()
-        self.user_data["promo_history"].append({
+        self._last_promo_epoch = time.time()
+        shown_at = datetime.fromtimestamp(self._last_promo_epoch).isoformat()
+        self.user_data["last_promo_shown"] = shown_at
+        history = self.user_data["promo_history"]
+        history.append({
             "promo_id": promo_id,
-            "shown_at": datetime.now().isoformat()
+            "shown_at": shown_at
         })
+        del history[:-PROMO_HISTORY_MAX]
         self.save_user_data()
-
-def show_promotional_message(parent, promo_data):
-    """Show a promotional message dialog and open the form URL in browser if clicked"""
-    dialog = QMessageBox(parent)
-    dialog.setWindowTitle(f"kno2gether - {promo_data['title']}")
-    dialog.setText(promo_data["message"])
-    if "details" in promo_data:
-        dialog.setInformativeText(promo_data["details"])
-    
-    # Set icon based on promotion type
-    dialog.setIcon(QMessageBox.Icon.Information)
-    
-    # Add custom buttons with styling
-    button_style = """
-        QPushButton {
-            padding: 8px 16px;
-            border: none;
-            border-radius: 4px;
-            font-size: 14px;
-            color: white;
-            min-width: 100px;
-        }
-        QPushButton:hover {
-            opacity: 0.9;
-        }
-    """
-    
-    # Create and style the OK button
-    ok_button = QPushButton("View Offer")
-    ok_button.setStyleSheet(button_style + """
-        QPushButton {
-            background-color: #4CAF50;
-        }
-        QPushButton:hover {
-            background-color: #45a049;
-        }
-    """)
-    dialog.addButton(ok_button, QMessageBox.ButtonRole.AcceptRole)
-    
-    # Create and style the Cancel button
-    cancel_button = QPushButton("Cancel")
-    cancel_button.setStyleSheet(button_style + """
-        QPushButton {
-            background-color: #757575;
-        }
-        QPushButton:hover {
-            background-color: #616161;
-        }
-    """)
-    dialog.addButton(cancel_button, QMessageBox.ButtonRole.RejectRole)
-    
-    # Store the URL to be opened
-    target_url = promo_data.get("form_url", "")
-    logger.info(f"Promotion dialog created for URL: {target_url}")
-    
-    # Set default button
-    dialog.setDefaultButton(ok_button)
-    
-    # Show dialog and handle response
-    clicked_button = dialog.exec()
-    
-    # Check which button was clicked and open the URL from promotions.json
-    if dialog.clickedButton() == ok_button and target_url:
-        logger.info(f"Opening promotion URL: {target_url}")
-        webbrowser.open(target_url)
-    
-    return True